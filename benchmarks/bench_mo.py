@@ -0,0 +1,50 @@
+"""
+Compares load times of ``pimpl.MOImpl`` and ``pimpl.JSONImpl`` on large catalogs.
+
+Usage:
+    python benchmarks/bench_mo.py [keys count] [repeats]
+"""
+
+from pathlib import Path
+import sys
+import tempfile
+import timeit
+import types
+
+from sl10n import SL10n, SLocale
+from sl10n.pimpl import JSONImpl, MOImpl
+
+
+def make_container(keys_count: int):
+    annotations = {f'key_{i}': 'str' for i in range(keys_count)}
+    return types.new_class('BenchLocale', (SLocale,), exec_body=lambda ns: ns.update(__annotations__=annotations))
+
+
+def main(keys_count: int = 2_000, repeats: int = 20):
+    container = make_container(keys_count)
+    data = {f'key_{i}': f'Translated text number {i} with some ünïcödé' for i in range(keys_count)}
+    impls = {'json': JSONImpl(indent=2, ensure_ascii=False), 'mo': MOImpl()}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, impl in impls.items():
+            path = Path(tmp) / name
+            path.mkdir()
+            file = path / f'en.{impl.file_ext}'
+            with impl.open(file, 'w') as f:
+                impl.dump(data, f)
+
+            def load():
+                with impl.open(file) as f:
+                    impl.load(f)
+
+            def init():
+                SL10n(container, path, parsing_impl=impl).init()
+
+            load_time = min(timeit.repeat(load, number=1, repeat=repeats))
+            init_time = min(timeit.repeat(init, number=1, repeat=repeats))
+            print(f'{name:>4}: load {load_time * 1000:8.3f} ms, SL10n.init() {init_time * 1000:8.3f} ms '
+                  f'({file.stat().st_size} bytes, {keys_count} keys)')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,69 @@
+"""
+Measures ``SL10n.locale()`` + attribute/``SLocale.get()`` lookup throughput at different thread counts.
+
+On a free-threaded CPython build (e.g. 3.13t with ``PYTHON_GIL=0``) throughput should scale
+near-linearly with the thread count, on a regular build it stays flat because of the GIL.
+
+Usage:
+    python benchmarks/bench_threads.py [lookups per thread] [languages]
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+
+from sl10n import SL10n, SLocale
+from sl10n.pimpl import JSONImpl
+
+
+THREADS = (1, 2, 4, 8, 16)
+
+
+class BenchLocale(SLocale):
+    title: str
+    text: str
+    conclusion: str
+
+
+def worker(l10n: SL10n, langs: list, lookups: int, barrier: threading.Barrier) -> None:
+    barrier.wait()
+    for i in range(lookups):
+        locale = l10n.locale(langs[i % len(langs)])
+        locale.title
+        locale.get('text')
+
+
+def main(lookups: int = 200_000, langs_count: int = 8):
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil else "disabled"}')
+
+    with tempfile.TemporaryDirectory() as tmp:
+        impl = JSONImpl()
+        langs = [f'l{i}' for i in range(langs_count)]
+        for lang in langs + ['en']:
+            with impl.open(Path(tmp) / f'{lang}.json', 'w') as f:
+                impl.dump({'title': f'Title {lang}', 'text': f'Text {lang}', 'conclusion': f'Conclusion {lang}'}, f)
+
+        l10n = SL10n(BenchLocale, tmp).init()
+
+        baseline = None
+        for threads in THREADS:
+            barrier = threading.Barrier(threads + 1)
+            with ThreadPoolExecutor(threads) as pool:
+                futures = [pool.submit(worker, l10n, langs, lookups, barrier) for _ in range(threads)]
+                barrier.wait()
+                start = time.perf_counter()
+                for future in futures:
+                    future.result()
+                elapsed = time.perf_counter() - start
+
+            throughput = threads * lookups / elapsed
+            baseline = baseline or throughput
+            print(f'{threads:>2} threads: {throughput:12,.0f} lookups/s, scaling x{throughput / baseline:.2f}')
+
+
+if __name__ == '__main__':
+    main(*map(int, sys.argv[1:]))
@@ -2,8 +2,9 @@
 
 UTF8 = 'utf-8'
 
+from .context import current
 from .core import SL10n
 from .locale import SLocale
 
-__all__ = ['SL10n', 'SLocale']
+__all__ = ['SL10n', 'SLocale', 'current']
 __version__ = '0.3.0.0'
@@ -0,0 +1,70 @@
+"""
+Command line interface.
+
+Usage:
+    python -m sl10n memory-report PATH MODULE:CONTAINER [--top N] [--trace]
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import os
+import sys
+from typing import Sequence
+
+from . import SL10n
+from .storage import DirectoryStorage
+
+
+def _import_container(spec: str):
+    module_name, _, name = spec.partition(':')
+    if not name:
+        raise argparse.ArgumentTypeError(f'Expected "module:Container", got "{spec}".')
+
+    try:
+        obj = importlib.import_module(module_name)
+        for attr in name.split('.'):
+            obj = getattr(obj, attr)
+    except (ImportError, AttributeError) as e:
+        raise argparse.ArgumentTypeError(f'Can\'t import "{spec}": {e}') from None
+    return obj
+
+
+def memory_report(args: argparse.Namespace) -> int:
+    # a report must never touch translation files (no redumps and no generated default file)
+    storage = DirectoryStorage(args.path, SL10n.default_pimpl)
+    storage.read_only = True
+    if not storage.exists(args.default_lang):
+        args.parser.error(f'Can\'t find "{storage.location(args.default_lang)}".')
+
+    l10n = SL10n(args.container, args.path, default_lang=args.default_lang, storage=storage)
+    print(l10n.init(trace_memory=args.trace).memory_report(args.top).format())
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog='sl10n', description='sl10n command line tools.')
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    report = commands.add_parser('memory-report', help='Report how much memory loaded locale containers take.')
+    report.add_argument('path', help='Path to translation files directory.')
+    report.add_argument('container', type=_import_container,
+                        help='Locale container to use, as "module:Container".')
+    report.add_argument('--default-lang', default='en', help='Default language. Defaults to "en".')
+    report.add_argument('--top', type=int, default=10,
+                        help='How many largest keys and duplicated values to report. Defaults to 10.')
+    report.add_argument('--trace', action='store_true',
+                        help='Trace memory allocated while loading every file with tracemalloc.')
+    report.set_defaults(func=memory_report, parser=report)
+
+    # the console script doesn't put the current directory on sys.path, unlike "python -m sl10n"
+    if os.getcwd() not in sys.path:
+        sys.path.insert(0, os.getcwd())
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+HEY, STOP RIGHT THERE!
+
+Be aware that this code is not intended to be used outside the module.
+Any implementation detail can be changed at any time without warning.
+If you need to manipulate it in any way, you're absolutely screwed.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, OrderedDict
+import sys
+import threading
+from typing import Iterable, NamedTuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a bounded locale cache (see ``SL10n.cache_info()``)."""
+
+    hits: int
+    misses: int
+    evictions: int
+    maxsize: int | None
+    maxbytes: int | None
+    currsize: int
+    currbytes: int
+
+
+_VIEW_ATTRS = ('_sl10n_escaped', '_sl10n_tracked')
+
+
+def cached_views(locale) -> list:
+    """Returns views cached in a locale container: escaped ones (see ``SLocale.escaped()``) and a tracked copy."""
+
+    data = getattr(locale, '__dict__', None)
+    if not data:
+        return []
+
+    views = list(data.get('_sl10n_escaped', {}).values())
+    if (tracked := data.get('_sl10n_tracked')) is not None:
+        views.append(tracked[1])
+    return views
+
+
+def estimate_size(locale, seen: set[int] | None = None) -> int:
+    """
+    Roughly estimates how much memory a locale container takes (the container, its dict and strings),
+    including views cached in it. Strings shared by views are counted once (``seen`` holds ids of counted ones).
+    """
+
+    if seen is None:
+        seen = set()
+
+    size = sys.getsizeof(locale)
+    data = getattr(locale, '__dict__', None)
+    if data is not None:
+        size += sys.getsizeof(data)
+        for key, value in data.items():
+            if key in _VIEW_ATTRS:
+                size += sys.getsizeof(value)
+            elif id(value) not in seen:
+                seen.add(id(value))
+                size += sys.getsizeof(value)
+        size += sum(estimate_size(view, seen) for view in cached_views(locale))
+    return size
+
+
+class _LocaleCache(OrderedDict):
+    POLICIES = ('lru', 'lfu')
+
+    def __init__(self, maxsize: int | None = None, maxbytes: int | None = None, policy: str = 'lru',
+                 pinned: Iterable[str] = ()):
+        super().__init__()
+
+        if policy not in self.POLICIES:
+            raise ValueError(f'Unknown eviction policy "{policy}", expected one of: {", ".join(self.POLICIES)}')
+
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.policy = policy
+        self.pinned = set(pinned)
+
+        self.hits = self.misses = self.evictions = 0
+        self.currbytes = 0
+        self._sizes: dict[str, int] = {}
+        self._uses: Counter[str] = Counter()
+        self._lock = threading.RLock()
+
+    def get(self, lang, default=None):
+        with self._lock:
+            locale = super().get(lang)
+            if locale is None:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            if self.policy == 'lru':
+                self.move_to_end(lang)
+            else:
+                self._uses[lang] += 1
+            return locale
+
+    def __setitem__(self, lang, locale):
+        with self._lock:
+            if lang in self:
+                self._forget(lang)
+            super().__setitem__(lang, locale)
+
+            self._sizes[lang] = size = estimate_size(locale)
+            self.currbytes += size
+            self._uses[lang] += 1
+            self._evict(keep=lang)
+
+    def __delitem__(self, lang):
+        with self._lock:
+            self._forget(lang)
+            super().__delitem__(lang)
+
+    def _forget(self, lang):
+        # use counts are kept: otherwise a reloaded language would always be the next LFU victim
+        self.currbytes -= self._sizes.pop(lang, 0)
+
+    def _overflown(self) -> bool:
+        return (self.maxsize is not None and len(self) > self.maxsize) \
+            or (self.maxbytes is not None and self.currbytes > self.maxbytes)
+
+    def _evict(self, keep: str):
+        # pinned languages count towards the limits, but are never evicted. Other languages are evicted first,
+        # then the newcomer itself (it's still returned to the caller, just not kept)
+        while self._overflown():
+            candidates = [lang for lang in self if lang != keep and lang not in self.pinned]
+            if not candidates:
+                if keep in self.pinned or keep not in self:
+                    return
+                candidates = [keep]
+
+            if self.policy == 'lru':
+                victim = candidates[0]
+            else:
+                victim = min(candidates, key=self._uses.__getitem__)
+
+            self._forget(victim)
+            super().__delitem__(victim)
+            self.evictions += 1
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, self.maxbytes,
+                             len(self), self.currbytes)
@@ -0,0 +1,67 @@
+"""
+HEY, STOP RIGHT THERE!
+
+Be aware that this code is not intended to be used outside the module.
+Any implementation detail can be changed at any time without warning.
+If you need to manipulate it in any way, you're absolutely screwed.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Mapping
+
+
+def normalize_tag(tag: str) -> str:
+    return tag.strip().replace('_', '-').lower()
+
+
+def parse_accept_language(header: str) -> list[str]:
+    """Parses an Accept-Language header into language tags ordered by their quality values."""
+
+    weighted = []
+    for i, part in enumerate(header.split(',')):
+        tag, *params = part.split(';')
+        if not (tag := tag.strip()):
+            continue
+
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition('=')
+            if name.strip().lower() == 'q':
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+
+        if q > 0:
+            weighted.append((-q, i, tag))
+
+    return [tag for _, _, tag in sorted(weighted)]
+
+
+def negotiate(requested: Iterable[str], available: Mapping[str, str]) -> str | None:
+    """
+    Matches requested language tags against available ones (normalized tag -> lang).
+
+    Every tag is looked up with subtags truncated one by one (RFC 4647 "lookup"), in the order of preference.
+    If nothing matches, falls back to any available tag with the same primary language.
+    A ``*`` tag ends both passes (tags after it are ignored), so the default language is used after that.
+    """
+
+    requested = [normalize_tag(tag) for tag in requested]
+    if '*' in requested:
+        requested = requested[:requested.index('*')]
+
+    for tag in requested:
+        while tag:
+            if (lang := available.get(tag)) is not None:
+                return lang
+            tag = tag.rpartition('-')[0]
+
+    for tag in requested:
+        primary = tag.partition('-')[0]
+        for available_tag, lang in available.items():
+            if available_tag.partition('-')[0] == primary:
+                return lang
+
+    return None
@@ -10,14 +10,13 @@ from __future__ import annotations
 
 from dataclasses import fields
 import logging
-from pathlib import Path
 from typing import Type, TypeVar
 import warnings
 
-from . import UTF8
-from .pimpl import ParsingImpl
+from .diagnostics import FileDiagnostics
 from .locale import SLocale
 from .modifiers import PreModifiers, PostModifiers
+from .storage import Storage
 from .warnings import UndefinedLocaleKey, UnexpectedLocaleKey, UnfilledLocaleKey, UnknownModifier
 
 T = TypeVar('T')
@@ -26,25 +25,34 @@ logger = logging.getLogger('sl10n')
 
 class _LocaleProcessor:
     EXCLUDE_SIGNAL = 0x01
+    MAX_KEYS_IN_WARNING = 10
 
-    filepath: Path
+    lang: str
+    location: str
     data: dict
     all_dumped_fields: list[str]
+    diagnostics: FileDiagnostics
     
-    def __init__(self, locale_container: Type[T], parsing_impl: ParsingImpl, is_strict: bool, warn_unfilled_keys: bool):
+    def __init__(self, locale_container: Type[T], storage: Storage, is_strict: bool, warn_unfilled_keys: bool):
         self.locale_container = locale_container
-        self.parsing_impl = parsing_impl
+        self.storage = storage
         self.is_strict = is_strict
         self.warn_unfilled_keys = warn_unfilled_keys
 
         self.all_fields = [k.name for k in fields(locale_container)]
         self.lc_fields = {k.name: k.type for k in fields(locale_container) if k not in fields(SLocale)}
         
-    def process(self, filepath: Path) -> T | None:
-        self.filepath = filepath
+    def process(self, lang: str, output_container: Type[T] | None = None) -> T | None:
+        """
+        Loads and checks translations of a language against the locale container.
+        If ``output_container`` is passed, only its keys are packed into it (see ``SL10n(only_keys=...)``).
+        """
 
-        with open(filepath, encoding=UTF8) as f:
-            self.data = self.parsing_impl.load(f)
+        self.lang = lang
+        self.location = self.storage.location(lang)
+        self.diagnostics = FileDiagnostics(self.location)
+
+        self.data = self.storage.load(lang)
 
         premodifiers, postmodifiers = self.parse_modifiers()
         modifiers = dict(premodifiers._asdict(), **postmodifiers._asdict())
@@ -72,12 +80,15 @@ class _LocaleProcessor:
         for key in used_modifiers + unexpected_keys:
             del self.data[key]
 
+        if output_container is not None:
+            self.data = {key: self.data[key] for key in output_container._field_names}  # noqa
+
         # Join strings in arrays with '\n'
         for key, val in self.data.items():
             if isinstance(val, list):
                 self.data[key] = '\n'.join(val)
 
-        return self.locale_container(**self.data)
+        return (output_container or self.locale_container)(**self.data)
 
     def parse_modifiers(self):
         premod, postmod = {}, {}
@@ -92,46 +103,62 @@ class _LocaleProcessor:
 
     def apply_premodifiers(self, premodifiers: PreModifiers):
         if premodifiers.exclude:
-            logger.debug(f'Excluding {self.filepath.name}...')
+            logger.debug(f'Excluding {self.location}...')
             return self.EXCLUDE_SIGNAL
 
     def apply_postmodifiers(self, postmodifiers: PostModifiers):
         if postmodifiers.redump:
-            logger.debug(f'Redumping {self.filepath.name}...')
+            logger.debug(f'Redumping {self.location}...')
             self.redump()
         if postmodifiers.lang_code:
-            logger.debug(f'Changing lang code of "{self.filepath.name}" to "{postmodifiers.lang_code}"')
+            logger.debug(f'Changing lang code of "{self.location}" to "{postmodifiers.lang_code}"')
             self.data['lang_code'] = postmodifiers.lang_code
         else:
-            self.data['lang_code'] = self.filepath.stem
+            self.data['lang_code'] = self.lang
 
     def redump(self):
-        with open(self.filepath, 'w', encoding=UTF8) as f:
-            self.data = {key: self.data[key] for key in self.all_dumped_fields}  # fixing pairs order
-            self.parsing_impl.dump(self.data, f)
+        self.data = {key: self.data[key] for key in self.all_dumped_fields}  # fixing pairs order
+        if not self.storage.redumpable:
+            logger.debug(f'Skipping redump of {self.location}, storage is read-only or not redumpable')
+            return
+        self.storage.dump(self.lang, self.data)
+
+    def warn(self, keys: list[str], what: str, category: type[Warning], verb: str = 'Found'):
+        # one warning per file and category: warnings.warn() is too expensive to call for every key
+        if not keys:
+            return
+
+        if len(keys) == 1:
+            message = f'{verb} {what} "{keys[0]}" in "{self.location}"'
+        else:
+            shown = ', '.join(f'"{key}"' for key in keys[:self.MAX_KEYS_IN_WARNING])
+            if len(keys) > self.MAX_KEYS_IN_WARNING:
+                shown += f' and {len(keys) - self.MAX_KEYS_IN_WARNING} more'
+            message = f'{verb} {len(keys)} {what}s in "{self.location}": {shown}'
+
+        warnings.warn(message, category, stacklevel=5)
 
     def find_undefined_keys(self):
-        undefined_keys = set(self.lc_fields.keys()) - set(self.data)
+        undefined_keys = [key for key in self.lc_fields if key not in self.data]
 
-        for key in undefined_keys:
-            warnings.warn(f'Found undefined key "{key}" in "{self.filepath}"', UndefinedLocaleKey, stacklevel=4)
+        self.diagnostics.undefined_keys = undefined_keys
+        self.warn(undefined_keys, 'undefined key', UndefinedLocaleKey)
 
-        return list(undefined_keys)
+        return undefined_keys
 
     def find_unexpected_keys(self, possible_fields):
-        unexpected_keys = set(self.data) - set(possible_fields)
-
-        for key in unexpected_keys:
+        possible_fields = set(possible_fields)
+        unexpected_keys = [key for key in self.data if key not in possible_fields]
 
-            if key.startswith('$'):
-                warnings.warn(f'Found unknown modifier "{key}" in "{self.filepath}"', UnknownModifier, stacklevel=4)
-            else:
-                warnings.warn(f'Found unexpected key "{key}" in "{self.filepath}"', UnexpectedLocaleKey, stacklevel=4)
+        self.diagnostics.unknown_modifiers = [key for key in unexpected_keys if key.startswith('$')]
+        self.diagnostics.unexpected_keys = [key for key in unexpected_keys if not key.startswith('$')]
+        self.warn(self.diagnostics.unknown_modifiers, 'unknown modifier', UnknownModifier)
+        self.warn(self.diagnostics.unexpected_keys, 'unexpected key', UnexpectedLocaleKey)
 
-        return list(unexpected_keys)
+        return unexpected_keys
 
     def check_unfilled_keys(self):
-        unfilled_keys = set(k for k, v in self.data.items() if k == v or v == '')
+        unfilled_keys = [k for k, v in self.data.items() if k == v or v == '']
 
-        for key in unfilled_keys:
-            warnings.warn(f'Got unfilled key "{key}" in "{self.filepath}"', UnfilledLocaleKey, stacklevel=4)
+        self.diagnostics.unfilled_keys = unfilled_keys
+        self.warn(unfilled_keys, 'unfilled key', UnfilledLocaleKey, verb='Got')
@@ -0,0 +1,50 @@
+"""
+HEY, STOP RIGHT THERE!
+
+Be aware that this code is not intended to be used outside the module.
+Any implementation detail can be changed at any time without warning.
+If you need to manipulate it in any way, you're absolutely screwed.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import pickle
+from typing import Iterable
+from weakref import WeakValueDictionary
+
+# SL10n objects with pickle_by_reference=True, mapped by their registry ids
+registry: WeakValueDictionary = WeakValueDictionary()
+
+
+def content_hash(values: Iterable[str | None]) -> str:
+    return hashlib.blake2b('\0'.join(v or '' for v in values).encode('utf-8'), digest_size=8).hexdigest()
+
+
+def _lookup(registry_id: str):
+    if (l10n := registry.get(registry_id)) is None:
+        raise pickle.UnpicklingError(f'Can\'t find SL10n "{registry_id}" in this process. Create it with the same '
+                                     f'locale container and storage, pickle_by_reference=True, and init it first.')
+    return l10n
+
+
+def restore_sl10n(registry_id: str):
+    return _lookup(registry_id)
+
+
+def restore_locale(registry_id: str, lang: str, expected_hash: str, fallback: tuple | None = None):
+    # fallback is a by-value reduce tuple of the pickled container (see SL10n(pickle_fallback=True))
+    try:
+        locale = _lookup(registry_id)._get_locale(lang)  # noqa
+        if locale is None:
+            raise pickle.UnpicklingError(f'Can\'t find "{lang}" locale in SL10n "{registry_id}".')
+
+        ref = getattr(locale, '__dict__', {}).get('_sl10n_ref')
+        if ref is None or ref[2] != expected_hash:
+            raise pickle.UnpicklingError(f'"{lang}" locale in SL10n "{registry_id}" differs from the pickled one.')
+    except pickle.UnpicklingError:
+        if fallback is None:
+            raise
+        restore, args = fallback
+        return restore(*args)
+    return locale
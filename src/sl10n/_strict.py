@@ -6,6 +6,8 @@ Any implementation detail can be changed at any time without warning.
 If you need to manipulate it in any way, you're absolutely screwed.
 """
 
+from __future__ import annotations
+
 from functools import wraps
 import warnings
 
@@ -28,3 +30,12 @@ def strict_wrapper(func):
         return result
 
     return inner
+
+
+def strict_warn(is_strict: bool, message: str, category: type[Warning], stacklevel: int = 1) -> None:
+    # unlike strict_wrapper, doesn't touch process-global warnings state (catch_warnings isn't thread-safe),
+    # so it's used on lookup paths called from many threads
+    if is_strict:
+        raise SL10nStrictException([warnings.WarningMessage(category(message), category, '', 0)])
+
+    warnings.warn(message, category, stacklevel=stacklevel + 1)
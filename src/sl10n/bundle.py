@@ -0,0 +1,214 @@
+"""Front-end bundle export: minified, content-hashed and pre-compressed per-language JSON bundles."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import tempfile
+from typing import Any, Callable, Iterator, TypeVar
+
+from . import UTF8
+from .core import SL10n
+from .exceptions import SL10nIsNotInitialized
+
+
+__all__ = ['BundleExporter']
+
+PathLike = TypeVar('PathLike', str, os.PathLike)
+logger = logging.getLogger('sl10n')
+
+
+def _brotli_compressor() -> Callable[[bytes], bytes] | None:
+    for module_name in ('brotli', 'brotlicffi'):
+        try:
+            module = __import__(module_name)
+        except ImportError:
+            continue
+        return module.compress
+    return None
+
+
+class BundleExporter:
+    """
+    Writes loaded locales into minified JSON bundles with content-hashed filenames,
+    ready to be served to web clients.
+
+    Every bundle gets pre-compressed ``.gz`` variant and ``.br`` variant
+    (the latter only if ``brotli`` or ``brotlicffi`` is installed).
+    Bundles are listed in a manifest (``manifest.json``), so the client knows what file to fetch:
+    ```json
+    {
+      "version": 1,
+      "bundles": {
+        "en": {"file": "en.1a2b3c4d5e.json", "hash": "1a2b3c4d5e...", "size": 1024,
+               "gz": "en.1a2b3c4d5e.json.gz", "br": "en.1a2b3c4d5e.json.br"}
+      }
+    }
+    ```
+
+    Since filenames depend on the content, bundles that didn't change are not rewritten.
+
+    Example:
+        ```python
+        l10n = sl10n.SL10n(MyLocale).init()
+
+        exporter = BundleExporter(l10n, 'dist/lang', namespace_sep='__')
+        manifest = exporter.export()
+        ```
+    """
+
+    manifest_name = 'manifest.json'
+    manifest_version = 1
+
+    def __init__(self, l10n: SL10n, path: Path | PathLike, *, namespace_sep: str | None = None,
+                 default_namespace: str = 'common', hash_length: int = 10, compress: bool = True,
+                 include_lang_code: bool = False, prune: bool = True):
+        """
+        Parameters:
+            l10n (SL10n):
+                Initialized ``SL10n`` object to export locales from.
+            path (str | os.PathLike | pathlib.Path):
+                Path to the output directory. Created if it doesn't exist.
+            namespace_sep (str, optional):
+                If set, keys are split into namespaces by the part before this separator
+                (e.g. ``'__'`` puts ``menu__title`` into ``menu`` namespace),
+                and every namespace gets its own bundle. Defaults to ``None`` (one bundle per language).
+            default_namespace (str, optional):
+                Namespace for keys without a separator. Defaults to ``'common'``.
+            hash_length (int, optional):
+                How many hex digits of content hash to put into filenames. Defaults to ``10``.
+            compress (bool, optional):
+                If ``True``, writes pre-compressed variants of every bundle. Defaults to ``True``.
+            include_lang_code (bool, optional):
+                If ``True``, ``lang_code`` is saved in every bundle as well. Defaults to ``False``.
+            prune (bool, optional):
+                If ``True``, removes bundles listed in the previous manifest that are no longer used.
+                Defaults to ``True``.
+        """
+
+        self.l10n = l10n
+        self.path = Path(path)
+        self.namespace_sep = namespace_sep
+        self.default_namespace = default_namespace
+        self.hash_length = hash_length
+        self.compress = compress
+        self.include_lang_code = include_lang_code
+        self.prune = prune
+
+        self._brotli = _brotli_compressor() if compress else None
+
+    def bundles(self) -> Iterator[tuple[str, bytes]]:
+        """
+        Returns:
+            An iterator of ``(bundle name, minified JSON content)`` pairs.
+            Bundle name is either ``lang`` or ``lang/namespace``.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        if not self.l10n.initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.l10n.__class__.__name__))
+
+        for lang in self.l10n.languages:
+            items = self.l10n._get_locale(lang).items(self.include_lang_code)  # noqa
+            if self.namespace_sep is None:
+                yield lang, self._minify(dict(items))
+                continue
+
+            namespaces: dict[str, dict[str, Any]] = {}
+            for key, value in items:
+                namespace = key.split(self.namespace_sep, 1)[0] if self.namespace_sep in key \
+                    else self.default_namespace
+                namespaces.setdefault(namespace, {})[key] = value
+
+            for namespace, data in namespaces.items():
+                yield f'{lang}/{namespace}', self._minify(data)
+
+    def export(self) -> dict[str, Any]:
+        """
+        Writes all bundles and the manifest into the output directory.
+
+        Returns:
+            The manifest.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        if not self.path.exists():
+            self.path.mkdir(parents=True)
+
+        previous = self._read_manifest()
+        manifest: dict[str, Any] = {'version': self.manifest_version, 'bundles': {}}
+
+        for name, content in self.bundles():
+            digest = hashlib.sha256(content).hexdigest()
+            filename = f'{name.replace("/", ".")}.{digest[:self.hash_length]}.json'
+            entry = {'file': filename, 'hash': digest, 'size': len(content)}
+
+            self._write(filename, content)
+            if self.compress:
+                entry['gz'] = self._write(filename + '.gz', content, lambda c: gzip.compress(c, 9, mtime=0))
+                if self._brotli is not None:
+                    entry['br'] = self._write(filename + '.br', content, self._brotli)
+
+            manifest['bundles'][name] = entry
+
+        if self.prune and previous:
+            self._prune(previous, manifest)
+
+        if manifest != previous:
+            self._write_file(self.path / self.manifest_name,
+                             json.dumps(manifest, ensure_ascii=False, indent=2).encode(UTF8))
+
+        return manifest
+
+    @staticmethod
+    def _minify(data: dict[str, Any]) -> bytes:
+        return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode(UTF8)
+
+    def _write(self, filename: str, content: bytes, codec: Callable[[bytes], bytes] | None = None) -> str:
+        path = self.path / filename
+        if path.exists():  # the name contains the content hash, so the file is up-to-date
+            return filename
+
+        logger.debug(f'Writing bundle {filename}...')
+        self._write_file(path, codec(content) if codec is not None else content)
+        return filename
+
+    @staticmethod
+    def _write_file(path: Path, content: bytes) -> None:
+        # an interrupted export must not leave a truncated file: bundles are never rewritten once they exist
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def _read_manifest(self) -> dict[str, Any] | None:
+        path = self.path / self.manifest_name
+        if not path.exists():
+            return None
+
+        with open(path, encoding=UTF8) as f:
+            return json.load(f)
+
+    def _prune(self, previous: dict[str, Any], manifest: dict[str, Any]) -> None:
+        def filenames(m):
+            for entry in m.get('bundles', {}).values():
+                yield from (entry[k] for k in ('file', 'gz', 'br') if k in entry)
+
+        for filename in set(filenames(previous)) - set(filenames(manifest)):
+            path = self.path / filename
+            if path.exists():
+                logger.debug(f'Removing stale bundle {filename}...')
+                path.unlink()
@@ -0,0 +1,42 @@
+"""Locale container bound to the current context (see ``SL10n.use()``)."""
+
+from __future__ import annotations
+
+from contextvars import ContextVar
+
+from .locale import SLocale
+
+
+__all__ = ['current']
+
+_current_locale: ContextVar[SLocale] = ContextVar('sl10n_current_locale')
+
+
+def current() -> SLocale:
+    """
+    Returns:
+        A locale container bound to the current context by ``SL10n.use()``.
+
+    It's a single context variable lookup, so it's cheaper than ``SL10n.locale()`` in deep call stacks.
+    Every asyncio task and thread has its own context, so handlers running concurrently
+    don't see each other's locales.
+
+    Raises:
+        LookupError: When no locale container is bound to the current context.
+
+    Example:
+        ```python
+        def render_greeting() -> str:
+            locale: MyLocale = sl10n.current()
+            return locale.greeting
+
+        with l10n.use(request.lang):
+            render_greeting()
+        ```
+    """
+
+    try:
+        return _current_locale.get()
+    except LookupError:
+        raise LookupError('No locale is bound to the current context. '
+                          'Perhaps you forgot to use SL10n.use()?') from None
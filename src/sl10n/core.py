@@ -1,23 +1,37 @@
 from __future__ import annotations
 
-from dataclasses import fields
+from contextlib import contextmanager
+from dataclasses import fields, is_dataclass
+from functools import lru_cache
 from os import PathLike as _PathLike
 from pathlib import Path
-from typing import Generic, Iterable, Type, TypeVar
+from typing import Any, Generic, Iterable, Iterator, Mapping, Type, TypeVar
 import sys
+import threading
+import tracemalloc
 import warnings
 
 if sys.version_info >= (3, 11):
     from typing import Self
 
-from . import UTF8
+from ._cache import CacheInfo, _LocaleCache
+from ._negotiate import negotiate, normalize_tag, parse_accept_language
+from ._registry import content_hash, registry, restore_sl10n
+from .context import _current_locale
+from .diagnostics import LoadDiagnostics
+from .escape import get_escaper
 from .exceptions import SL10nIsNotInitialized
 from .locale import SLocale
+from .memory import MemoryReport, build_memory_report
 from .modifiers import PreModifiers, PostModifiers
 from .pimpl import ParsingImpl, JSONImpl
 from ._process import _LocaleProcessor as LocaleProcessor
-from ._strict import strict_wrapper
-from .warnings import DefaultLangFileNotFound, LangFileAlreadyExists, SL10nAlreadyInitialized, UndefinedLocale
+from ._strict import strict_warn, strict_wrapper
+from .shared import SharedLocaleStore
+from .storage import DirectoryStorage, Storage
+from .usage import UsageTracker, pruned_container
+from .warnings import (DefaultLangFileNotFound, LangFileAlreadyExists, SL10nAlreadyInitialized, UndefinedLocale,
+                       UnexpectedLocaleKey)
 
 
 T = TypeVar('T')
@@ -53,10 +67,16 @@ class SL10n(Generic[T]):
 
     default_path = Path.cwd() / 'lang'
     default_pimpl = JSONImpl(indent=2, ensure_ascii=False)
+    negotiation_cache_size = 1024
 
     def __init__(self, locale_container: Type[T], path: Path | PathLike = default_path, *, default_lang: str = 'en',
                  ignore_filenames: Iterable[str] = (), parsing_impl: ParsingImpl = default_pimpl, strict: bool = False,
-                 warn_unfilled_keys: bool = False):
+                 warn_unfilled_keys: bool = False, max_locales: int | None = None,
+                 max_locales_bytes: int | None = None, eviction: str = 'lru', track_usage: UsageTracker | None = None,
+                 only_keys: Iterable[str] | None = None, storage: Storage | None = None,
+                 only_langs: Iterable[str] | None = None, pickle_by_reference: bool = False,
+                 pickle_fallback: bool = False,
+                 escapers: Iterable[str] = ()):
         """
         Parameters:
             locale_container (Type[T]):
@@ -70,9 +90,52 @@ class SL10n(Generic[T]):
                 What filenames the parser should ignore. Defaults to ``()``.
             parsing_impl (ParsingImpl, optional):
                 What parsing implementation to use. Defaults to ``pimpl.JSONImpl(json, indent=2, ensure_ascii=False)``.
+            max_locales (int, optional):
+                If set, no more than this number of locale containers is kept in memory, including the default
+                language one, which is never evicted (so it's kept even if it alone exceeds the limit).
+                Rarely used ones are evicted and transparently reloaded from files on the next ``SL10n.locale()``.
+                Defaults to ``None`` (all locale containers are kept).
+            max_locales_bytes (int, optional):
+                The same as ``max_locales``, but limits estimated memory size of locale containers in bytes
+                (including escaped views computed at load, see ``escapers``).
+                Defaults to ``None``.
+            eviction (str, optional):
+                What locale containers to evict first: least recently used (``'lru'``)
+                or least frequently used (``'lfu'``). Default language is never evicted. Defaults to ``'lru'``.
+            track_usage (UsageTracker, optional):
+                If set, key reads from locale containers returned by ``SL10n.locale()`` are recorded into it
+                (see ``UsageTracker.sample()``). Defaults to ``None``.
+            only_keys (Iterable[str], optional):
+                If set, only these keys are loaded into smaller locale containers
+                (see ``sl10n.usage.pruned_container()``), files are still checked against the whole locale container.
+                Defaults to ``None`` (all keys are loaded).
+            storage (Storage, optional):
+                Where to read translations from (e.g. ``sl10n.storage.ZipStorage`` or ``sl10n.storage.SQLiteStorage``).
+                Defaults to ``sl10n.storage.DirectoryStorage(path, parsing_impl)``.
+            only_langs (Iterable[str], optional):
+                If set, only these languages are loaded (default language is always loaded).
+                Storage is not scanned for available languages then. Defaults to ``None`` (all languages are loaded).
+            pickle_by_reference (bool, optional):
+                If ``True``, this ``SL10n`` object and its locale containers are pickled as small references
+                (see ``SL10n.registry_id``) and restored from the receiving process' own initialized ``SL10n``
+                with the same locale container and storage. Useful to pass them to worker processes.
+                If the receiving process has no such ``SL10n`` or its locale differs from the pickled one,
+                ``pickle.UnpicklingError`` is raised (unless ``pickle_fallback`` is ``True``).
+                Defaults to ``False`` (locale containers are pickled by value).
+            pickle_fallback (bool, optional):
+                If ``True``, locale containers pickled by reference carry their values too, and are restored
+                from them when the receiving process can't restore them by reference. Payloads are as large as
+                by-value ones then. ``SL10n`` objects themselves are always pickled by reference only.
+                Defaults to ``False``.
+            escapers (Iterable[str], optional):
+                Names of escapers (see ``sl10n.escape``) to compute escaped views with
+                (see ``SLocale.escaped()``) when a locale is loaded. Defaults to ``()``
+                (views are computed on first access).
 
         Raises:
             TypeError: When locale_container is not an ``SLocale`` subclass or is an ``SLocale`` itself.
+            ValueError: When got an unknown eviction policy or escaper, or some of ``only_keys`` are not defined
+                in the locale container.
         """
 
         self._check_locale_container(locale_container)
@@ -86,15 +149,102 @@ class SL10n(Generic[T]):
         self.parsing_impl = parsing_impl
         self.file_ext = parsing_impl.file_ext
         self.is_strict = strict
+        self.storage = storage if storage is not None else DirectoryStorage(self.path, parsing_impl)
+        self.only_langs = None if only_langs is None else tuple(only_langs)
+        self.pickle_by_reference = pickle_by_reference
+        self.pickle_fallback = pickle_fallback
+        self.escapers = tuple(escapers)
+        for escaper in self.escapers:
+            get_escaper(escaper)
 
         self.locales: dict[str, T] = {}
-        self._locale_processor = LocaleProcessor(self.locale_container, self.parsing_impl, strict, warn_unfilled_keys)
+        if max_locales is not None or max_locales_bytes is not None:
+            self.locales = _LocaleCache(max_locales, max_locales_bytes, eviction, pinned=(default_lang,))
+        self._lang_files: dict[str, str] = {}
+        self._load_lock = threading.Lock()
+        # changes applied by apply_delta(persist=False), reapplied when an evicted language is reloaded
+        self._unpersisted: dict[str, dict[str, str]] = {}
+        self._lang_tags: dict[str, str] = {}
+        self._negotiate_cached = lru_cache(self.negotiation_cache_size)(self._negotiate)
+        self._shared_store: SharedLocaleStore | None = None
+        self._init_allocations: dict[str, int] | None = None
+        self.diagnostics = LoadDiagnostics()
+        """Issues found in translation files while ``SL10n.init()``."""
+        self.usage_tracker = track_usage
+        self._output_container = None
+        if only_keys is not None:
+            self._output_container = pruned_container(locale_container, only_keys)
+
+        self._locale_processor = LocaleProcessor(self.locale_container, self.storage, strict, warn_unfilled_keys)
         self._initialized = False
 
     @property
     def initialized(self) -> bool:
         return self._initialized
 
+    @property
+    def registry_id(self) -> str:
+        """
+        Identity of this ``SL10n`` used to pickle it by reference: locale container, storage identity
+        (see ``Storage.identity()``) and default language.
+
+        Note:
+            The locale container must be importable by the same path in every process.
+            The main script is an exception: it's ``__main__`` in the parent process and ``__mp_main__``
+            in processes spawned by ``multiprocessing``, both are treated as ``__main__``.
+        """
+
+        container = self.locale_container
+        module = '__main__' if container.__module__ == '__mp_main__' else container.__module__
+        return f'{module}.{container.__qualname__}@{self.storage.identity()}#{self.default_lang}'
+
+    def __reduce_ex__(self, protocol):
+        if self.pickle_by_reference:
+            return restore_sl10n, (self.registry_id,)
+        return super().__reduce_ex__(protocol)
+
+    def _store_locale(self, lang: str, locale: T) -> None:
+        if self.pickle_by_reference and is_dataclass(locale):
+            object.__setattr__(locale, '_sl10n_ref',
+                               (self.registry_id, lang, content_hash(v for _, v in locale.items()),
+                                self.pickle_fallback))
+        if is_dataclass(locale):
+            for escaper in self.escapers:
+                locale.escaped(escaper)
+        self.locales[lang] = locale
+
+    @property
+    def languages(self) -> tuple[str, ...]:
+        """All available languages, including ones currently evicted from memory."""
+
+        # every loaded language has its location recorded, unless locales were attached from shared memory
+        return tuple(self._lang_files) if self._lang_files else tuple(self.locales)
+
+    def cache_info(self) -> CacheInfo | None:
+        """
+        Returns:
+            Hits, misses and evictions statistics of locale containers if ``max_locales``
+            or ``max_locales_bytes`` is set. Otherwise, ``None``.
+        """
+
+        if isinstance(self.locales, _LocaleCache):
+            return self.locales.cache_info()
+        return None
+
+    def _get_locale(self, lang: str) -> T | None:
+        if (locale := self.locales.get(lang)) is not None:
+            return locale
+
+        if lang in self._lang_files:
+            with self._load_lock:  # the processor keeps per-file state
+                if lang in self.locales:  # loaded by another thread meanwhile
+                    return self.locales[lang]
+                if (locale := self._locale_processor.process(lang, self._output_container)) is not None:
+                    if changes := self._unpersisted.get(lang):
+                        locale = locale._replace(changes)
+                    self._store_locale(lang, locale)
+            return locale
+
     @staticmethod
     def _check_locale_container(locale_container) -> None:
         if not issubclass(locale_container, SLocale):
@@ -110,7 +260,7 @@ class SL10n(Generic[T]):
         print(f'PostModifiers available: {", ".join("$" + mod for mod in PostModifiers._fields)}')
 
     @strict_wrapper
-    def init(self) -> Self:
+    def init(self, *, trace_memory: bool = False) -> Self:
         """
         Load all locale files and pack their content into locale containers.
 
@@ -128,6 +278,19 @@ class SL10n(Generic[T]):
             l10n = sl10n.Sl10n(MyLocale).init()
             ```
 
+            Issues found in translation files are reported with one warning per file and category.
+            To handle them programmatically, use ``SL10n.diagnostics``:
+            ```python
+            diagnostics = sl10n.Sl10n(MyLocale).init().diagnostics
+            for lang, file_diagnostics in diagnostics.with_issues().items():
+                print(lang, file_diagnostics.undefined_keys)
+            ```
+
+        Parameters:
+            trace_memory (bool, optional):
+                If ``True``, memory allocated while loading every file is traced with ``tracemalloc``
+                and included into ``SL10n.memory_report()``. Slows loading down. Defaults to ``False``.
+
         Warns:
             SL10nAlreadyInitialized: When ``Sl10n`` is already initialized.
         """
@@ -136,22 +299,157 @@ class SL10n(Generic[T]):
             warnings.warn(SL10nAlreadyInitialized(), stacklevel=2)
             return
 
-        default_lang_file = Path(f'{self.default_lang}.{self.file_ext}')
-        if not (self.path / default_lang_file).exists():
-            err_message = f'Can\'t find "{default_lang_file}" in {self.path}.' if self.is_strict \
-                else f'Can\'t find "{default_lang_file}" in {self.path}, generating a file...'
+        if not self.storage.exists(self.default_lang):
+            location = self.storage.location(self.default_lang)
+            err_message = f'Can\'t find "{location}".' if self.is_strict \
+                else f'Can\'t find "{location}", generating a file...'
             warnings.warn(err_message, DefaultLangFileNotFound, stacklevel=2)
             self.create_lang_file(self.default_lang)
 
-        for file in self.path.glob(f'*.{self.file_ext}'):
-            if file.stem not in self.ignore_filenames:
-                if (locale := self._locale_processor.process(file)) is not None:
-                    self.locales[file.stem] = locale
+        started_tracing = trace_memory and not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+        if trace_memory:
+            self._init_allocations = {}
+
+        if self.only_langs is None:
+            langs = self.storage.langs()
+        else:
+            langs = [lang for lang in dict.fromkeys((self.default_lang, *self.only_langs))
+                     if self.storage.exists(lang)]
+
+        for lang in langs:
+            if lang not in self.ignore_filenames:
+                allocated_before = tracemalloc.get_traced_memory()[0] if trace_memory else 0
+
+                locale = self._locale_processor.process(lang, self._output_container)
+                self.diagnostics.files[lang] = self._locale_processor.diagnostics
+                if locale is not None:
+                    self._lang_files[lang] = self.storage.location(lang)
+                    self._register_lang_tags(lang, locale)
+                    self._store_locale(lang, locale)
+
+                    if trace_memory:
+                        self._init_allocations[lang] = tracemalloc.get_traced_memory()[0] - allocated_before
+
+        if started_tracing:
+            tracemalloc.stop()
+
+        if self.pickle_by_reference:
+            registry[self.registry_id] = self
 
         self._initialized = True
+        self._negotiate_cached.cache_clear()
         return self
 
-    @strict_wrapper
+    def share(self, name: str | None = None) -> SharedLocaleStore:
+        """
+        Packs all loaded locales into a shared memory segment,
+        so other processes can use them via ``SL10n.attach()`` without loading files.
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).init()
+            store = l10n.share()
+
+            # in worker processes
+            l10n = sl10n.Sl10n(MyLocale).attach(store.name)
+
+            # when all workers are done
+            store.close()
+            store.unlink()
+            ```
+
+        Parameters:
+            name (str, optional):
+                Name of the shared memory segment. Generated by the system if not set.
+
+        Returns:
+            A store that owns the segment. Keep a reference to it while other processes use it.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        if not self._initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.__class__.__name__))
+
+        locales = {lang: self._get_locale(lang) for lang in self.languages}
+        container = self._output_container or self.locale_container
+        return SharedLocaleStore.create(locales, container._field_names, name)  # noqa
+
+    def attach(self, name: str) -> Self:
+        """
+        Uses locales from a shared memory segment created by ``SL10n.share()`` instead of loading files.
+
+        Locales become read-only views (see ``sl10n.shared.SharedLocale``) which decode strings straight
+        from shared memory. It's used instead of ``SL10n.init()``.
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).attach('sl10n_locales')
+            print(l10n.locale('en').my_key_1)
+            ```
+
+        Parameters:
+            name (str):
+                Name of the shared memory segment.
+
+        Raises:
+            ValueError: When keys in the segment don't match the locale container.
+
+        Warns:
+            SL10nAlreadyInitialized: When ``Sl10n`` is already initialized.
+        """
+
+        if self._initialized:
+            warnings.warn(SL10nAlreadyInitialized(), stacklevel=2)
+            return self
+
+        store = SharedLocaleStore.attach(name)
+        container = self._output_container or self.locale_container
+        if set(store.keys) != set(container._field_names):  # noqa
+            store.close()
+            raise ValueError(f'Keys in shared memory segment "{name}" don\'t match '
+                             f'{self.locale_container.__name__} container.')
+
+        self._shared_store = store
+        self.locales = store.views()
+        for lang, locale in self.locales.items():
+            self._register_lang_tags(lang, locale)
+            for escaper in self.escapers:
+                locale.escaped(escaper)
+
+        self._initialized = True
+        self._negotiate_cached.cache_clear()
+        return self
+
+    def detach(self) -> None:
+        """
+        Detaches from a shared memory segment used since ``SL10n.attach()``.
+
+        Locales taken from this ``SL10n`` become unusable and it isn't initialized anymore.
+        Does nothing if locales weren't attached.
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).attach('sl10n_locales')
+            ...
+            l10n.detach()
+            ```
+        """
+
+        if self._shared_store is None:
+            return
+
+        self._shared_store.close()
+        self._shared_store = None
+        self.locales = {}
+        self._lang_tags.clear()
+        self._negotiate_cached.cache_clear()
+        self._initialized = False
+
     def locale(self, lang: str | None = None) -> T:
         """
         Returns a locale container, containing all defined string keys translated to the requested language
@@ -187,14 +485,188 @@ class SL10n(Generic[T]):
         if lang is None:
             lang = self.default_lang
 
-        if (locale := self.locales.get(lang)) is None:
+        if (locale := self._get_locale(lang)) is None:
             err_message = f'Got unexpected lang "{lang}".' if self.is_strict \
                             else f'Got unexpected lang "{lang}", returned "{self.default_lang}"'
-            warnings.warn(err_message, UndefinedLocale, stacklevel=2)
-            return self.locales[self.default_lang]
+            strict_warn(self.is_strict, err_message, UndefinedLocale, stacklevel=2)
+            locale = self.locales[self.default_lang]
 
+        if self.usage_tracker is not None:
+            return self.usage_tracker.sample(locale)
         return locale
 
+    @contextmanager
+    def use(self, lang: str | None = None) -> Iterator[T]:
+        """
+        Resolves a locale container once (the same as ``SL10n.locale()``) and binds it to the current context
+        for the duration of the ``with`` block, so it can be read with ``sl10n.current()``.
+
+        Context variables are used, so it works with asyncio tasks and threads,
+        and blocks can be nested (the previous locale is restored on exit).
+
+        Example:
+            ```python
+            async def handle(request):
+                with l10n.use(request.lang):
+                    return await process(request)  # sl10n.current() is available anywhere inside
+
+            ...
+
+            locale: MyLocale = sl10n.current()
+            ```
+
+        Parameters:
+            lang (str, optional):
+                Language you want to bind. Defaults to the default language.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        locale = self.locale(lang)
+        token = _current_locale.set(locale)
+        try:
+            yield locale
+        finally:
+            _current_locale.reset(token)
+
+    def memory_report(self, top: int = 10) -> MemoryReport:
+        """
+        Walks loaded locale containers and reports how much memory they take.
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).init(trace_memory=True)
+
+            report = l10n.memory_report()
+            print(report.format())
+            ```
+
+            The same report is available from the command line:
+            ```
+            python -m sl10n memory-report lang my_app.locale:MyLocale
+            ```
+
+        Parameters:
+            top (int, optional):
+                How many largest keys and duplicated values to report. Defaults to ``10``.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        if not self._initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.__class__.__name__))
+
+        return build_memory_report(self.locales, top, self._init_allocations)
+
+    def negotiate(self, accept: str | Iterable[str]) -> str:
+        """
+        Picks the best matching language for an Accept-Language header or a list of user preferences.
+
+        Language tags are matched case-insensitively against lang file names and ``$lang_code`` overrides,
+        subtags are truncated when there's no exact match (``'de-CH'`` matches ``'de'``).
+        If nothing matches, falls back to a language with the same primary subtag (``'en'`` matches ``'en-GB'``)
+        and then to the default language.
+
+        Results are cached (up to ``SL10n.negotiation_cache_size`` distinct requests).
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).init()
+
+            lang = l10n.negotiate(request.headers['Accept-Language'])  # 'de-CH,de;q=0.9,en;q=0.8' -> 'de'
+            locale = l10n.locale(lang)
+            ```
+
+        Parameters:
+            accept (str | Iterable[str]):
+                Accept-Language header value (with quality values)
+                or language tags ordered by preference.
+
+        Returns:
+            Language that can be passed into ``SL10n.locale()``.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        if not self._initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.__class__.__name__))
+
+        if not isinstance(accept, str):
+            accept = tuple(accept)
+        return self._negotiate_cached(accept)
+
+    def _negotiate(self, accept: str | tuple[str, ...]) -> str:
+        requested = parse_accept_language(accept) if isinstance(accept, str) else accept
+        lang = negotiate(requested, self._lang_tags)
+        return self.default_lang if lang is None else lang
+
+    def _register_lang_tags(self, lang: str, locale: T) -> None:
+        self._lang_tags[normalize_tag(lang)] = lang
+        if locale.lang_code:
+            self._lang_tags.setdefault(normalize_tag(locale.lang_code), lang)
+
+    def render_many(self, key: str, langs: Iterable[str | None], **params: Any) -> Iterator[str]:
+        """
+        Returns a string associated with the given key for every requested language,
+        formatted with ``params`` (if any).
+
+        Every distinct language is resolved and rendered only once, so it's much faster than calling
+        ``SL10n.locale()`` for every recipient when sending the same message to a lot of users.
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).init()
+
+            users = [...]
+            texts = l10n.render_many('greetings_text', (user.lang for user in users), bot_name='Bot')
+            for user, text in zip(users, texts):
+                send_message(user, text)
+            ```
+
+        Parameters:
+            key (str):
+                Key used to get strings.
+            langs (Iterable[str | None]):
+                Languages to render the string for. ``None`` stands for the default language.
+            **params (Any):
+                Parameters to format strings with (``str.format()``). If not passed, strings are returned as is.
+
+        Returns:
+            A generator of rendered strings in the same order as ``langs``.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+
+        Warns:
+            UnexpectedLocaleKey: When got an unexpected key (the key itself is rendered then).
+            UndefinedLocale: When got an unexpected lang (once per such lang, while iterating).
+        """
+
+        if not self._initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.__class__.__name__))
+
+        if key not in self._lc_fields:
+            strict_warn(self.is_strict, f'Got unexpected key "{key}", returned the key', UnexpectedLocaleKey,
+                        stacklevel=2)
+
+        return self._render_many(key, langs, params)
+
+    def _render_many(self, key: str, langs: Iterable[str | None], params: dict[str, Any]) -> Iterator[str]:
+        rendered: dict[str | None, str] = {}
+        for lang in langs:
+            if (text := rendered.get(lang)) is None:
+                text = getattr(self.locale(lang), key, key)
+                if params:
+                    text = text.format(**params)
+                rendered[lang] = text
+            yield text
+
     @strict_wrapper
     def create_lang_file(self, lang: str, override: bool = False):
         """
@@ -217,6 +689,9 @@ class SL10n(Generic[T]):
                 If ``True``, existing file will be overwritten.
                 Defaults to ``False``.
 
+        Raises:
+            PermissionError: When the storage is read-only.
+
         Warns:
             SL10nAlreadyInitialized: If ``SL10n`` is initialized.
             LangFileAlreadyExists: When the file already exists and ``override`` set to ``False``
@@ -229,13 +704,13 @@ class SL10n(Generic[T]):
                           stacklevel=2)
             return
 
-        path = self.path / Path(f'{lang}.{self.file_ext}')
-        if override is False and path.exists():
-            warnings.warn(f'Lang file "{path}" already exists.', LangFileAlreadyExists, stacklevel=2)
+        if override is False and self.storage.exists(lang):
+            warnings.warn(f'Lang file "{self.storage.location(lang)}" already exists.', LangFileAlreadyExists,
+                          stacklevel=2)
             return
 
-        p = self.path / Path(f'{self.default_lang}.{self.file_ext}')
-        sample = self._locale_processor.process(p) if p.exists() else self.locale_container.sample()
+        sample = self._locale_processor.process(self.default_lang) if self.storage.exists(self.default_lang) \
+            else self.locale_container.sample()
         sample = sample.to_dict()
 
         keys_to_remove = set()
@@ -248,8 +723,148 @@ class SL10n(Generic[T]):
         for k in keys_to_remove:
             del sample[k]
 
-        if not path.parent.exists():
-            path.parent.mkdir(parents=True)
+        self.storage.dump(lang, sample)
+
+    def apply_delta(self, delta: Mapping[str, Mapping[str, str | list[str]]], persist: bool = False) -> None:
+        """
+        Applies key-level translation changes to loaded locales without reloading files.
+
+        New locale containers are built from the existing ones plus the changes (unchanged strings are shared)
+        and swapped in atomically, so other threads see either an old or a new container, never a half-updated one.
+        All changes are validated before anything is applied.
+        Changes that aren't persisted survive eviction: they are reapplied when an evicted language is reloaded
+        (see ``max_locales``).
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).init()
+
+            l10n.apply_delta({'de': {'my_key_1': 'Neuer Text'}, 'fr': {'my_key_2': 'Nouveau texte'}}, persist=True)
+            ```
+
+        Parameters:
+            delta (Mapping[str, Mapping[str, str | list[str]]]):
+                Changed strings mapped by keys, mapped by languages.
+                Multiline strings may be passed as lists of lines, as in translation files.
+            persist (bool, optional):
+                If ``True``, changes are saved into the storage too, with a single write per language.
+                Defaults to ``False``.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+            ValueError: When got an unknown language, a key not defined in the locale container
+                or a value that is neither a string nor a list of strings. Nothing is applied then.
+            TypeError: When locales are attached from shared memory (they are read-only).
+            PermissionError: When ``persist`` is ``True``, but the storage is read-only or not redumpable
+                (see ``ParsingImpl.redumpable``).
+        """
+
+        if not self._initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.__class__.__name__))
+
+        if unknown_langs := [lang for lang in delta if lang not in self.languages]:
+            raise ValueError(f'Got unexpected langs: {", ".join(unknown_langs)}.')
+
+        lc_fields = set(self._lc_fields)
+        for lang, changes in delta.items():
+            if unknown_keys := [key for key in changes if key not in lc_fields]:
+                raise ValueError(f'Got unexpected keys for "{lang}": {", ".join(unknown_keys)}.')
+            if invalid_keys := [key for key, value in changes.items()
+                                if not (isinstance(value, str) or isinstance(value, list)
+                                        and all(isinstance(line, str) for line in value))]:
+                raise ValueError(f'Got values of keys for "{lang}" that are neither strings nor lists of strings: '
+                                 f'{", ".join(invalid_keys)}.')
+
+        if persist and not self.storage.redumpable:
+            raise PermissionError(f'{self.storage.__class__.__name__} is read-only or not redumpable.')
+
+        # everything is built first, then written, then swapped in:
+        # a failure leaves both files and loaded locales as they were
+        updated, applied, originals, payloads = {}, {}, {}, {}
+        for lang, changes in delta.items():
+            locale = self._get_locale(lang)
+            if not is_dataclass(locale):
+                raise TypeError(f'Locale "{lang}" is read-only.')
+
+            changes = {key: '\n'.join(value) if isinstance(value, list) else value for key, value in changes.items()}
+            # pruned containers (see only_keys) don't have all the keys
+            field_names = type(locale)._field_names
+            applied[lang] = {key: value for key, value in changes.items() if key in field_names}
+            updated[lang] = locale._replace(applied[lang])
+
+            if persist:
+                originals[lang] = self.storage.load(lang)
+                payloads[lang] = data = dict(originals[lang])
+                for key, value in changes.items():
+                    data[key] = value.split('\n') if '\n' in value else value
+
+        written = []
+        try:
+            for lang, data in payloads.items():
+                self.storage.dump(lang, data)
+                written.append(lang)
+        except BaseException:
+            for lang in written:
+                self.storage.dump(lang, originals[lang])
+            raise
+
+        with self._load_lock:
+            for lang, locale in updated.items():
+                if persist:
+                    # saved changes are reloaded from the storage, older unsaved ones of the same keys are gone
+                    for key in applied[lang]:
+                        self._unpersisted.get(lang, {}).pop(key, None)
+                else:
+                    self._unpersisted.setdefault(lang, {}).update(applied[lang])
+                self._store_locale(lang, locale)
+
+    def export_all(self, path: Path | PathLike, parsing_impl: ParsingImpl | None = None, *,
+                   include_lang_code: bool = False) -> list[Path]:
+        """
+        Exports all loaded locales into a requested directory, one file per language.
+
+        Locales are written one by one straight from their containers, no intermediate mapping of
+        all languages is built.
+
+        Example:
+            ```python
+            l10n = sl10n.Sl10n(MyLocale).init()
+            l10n.export_all('dist/lang', sl10n.pimpl.JSONImpl(separators=(',', ':')))
+            ```
+
+        Parameters:
+            path (str | os.PathLike | pathlib.Path):
+                Path to the output directory. Created if it doesn't exist.
+            parsing_impl (ParsingImpl, optional):
+                What parsing implementation to use. Defaults to the one used by ``SL10n``.
+            include_lang_code (bool, optional):
+                If ``True``, ``lang_code`` is saved as well. Defaults to ``False``.
+
+        Returns:
+            A list of paths to exported files.
+
+        Raises:
+            SL10nIsNotInitialized: When ``SL10n`` isn't initialized.
+        """
+
+        if not self._initialized:
+            raise SL10nIsNotInitialized('{0} was not initialized. Perhaps you forgot to call {0}.init()?'
+                                        .format(self.__class__.__name__))
+
+        if parsing_impl is None:
+            parsing_impl = self.parsing_impl
+
+        path = Path(path)
+        if not path.exists():
+            path.mkdir(parents=True)
+
+        exported = []
+        for lang in self.languages:
+            locale = self._get_locale(lang)
+            file = path / f'{lang}.{parsing_impl.file_ext}'
+            with parsing_impl.open(file, 'w') as f:
+                locale.dump(f, parsing_impl, include_lang_code=include_lang_code)
+            exported.append(file)
 
-        with open(path, 'w', encoding=UTF8) as f:
-            self.parsing_impl.dump(sample, f)
+        return exported
@@ -0,0 +1,60 @@
+"""Structured report of issues found in translation files while loading them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+
+__all__ = ['FileDiagnostics', 'LoadDiagnostics']
+
+
+@dataclass
+class FileDiagnostics:
+    """Issues found in a single translation file."""
+
+    path: str
+    """Path to the file."""
+
+    undefined_keys: list[str] = field(default_factory=list)
+    """Keys defined in the locale container, but missing in the file (they are added to the file)."""
+
+    unexpected_keys: list[str] = field(default_factory=list)
+    """Keys found in the file, but not defined in the locale container."""
+
+    unknown_modifiers: list[str] = field(default_factory=list)
+    """Modifiers (``$``-prefixed keys) that sl10n doesn't know about."""
+
+    unfilled_keys: list[str] = field(default_factory=list)
+    """Keys with empty values or values equal to their keys (only with ``SL10n(warn_unfilled_keys=True)``)."""
+
+    def __bool__(self) -> bool:
+        return bool(self.undefined_keys or self.unexpected_keys or self.unknown_modifiers or self.unfilled_keys)
+
+
+@dataclass
+class LoadDiagnostics:
+    """
+    Issues found in all translation files while ``SL10n.init()``.
+
+    Available as ``SL10n.diagnostics``:
+    ```python
+    l10n = sl10n.SL10n(MyLocale).init()
+
+    for lang, diagnostics in l10n.diagnostics.files.items():
+        print(lang, diagnostics.undefined_keys)
+    ```
+    """
+
+    files: dict[str, FileDiagnostics] = field(default_factory=dict)
+    """Issues of every loaded file, mapped by languages."""
+
+    def __bool__(self) -> bool:
+        return any(self.files.values())
+
+    def with_issues(self) -> dict[str, FileDiagnostics]:
+        """
+        Returns:
+            Issues of files that have any, mapped by languages.
+        """
+
+        return {lang: diagnostics for lang, diagnostics in self.files.items() if diagnostics}
@@ -0,0 +1,78 @@
+"""Escapers for precomputed escaped views of locale containers (see ``SLocale.escaped()``)."""
+
+from __future__ import annotations
+
+import html
+import re
+from typing import Callable
+
+
+__all__ = ['register_escaper', 'get_escaper', 'escape_html', 'escape_markdown', 'escape_markdown_v2']
+
+_MARKDOWN_SPECIAL = re.compile(r'([\\`*_{}\[\]()#+\-.!|<>~])')
+_MARKDOWN_V2_SPECIAL = re.compile(r'([\\_*\[\]()~`>#+\-=|{}.!])')
+
+
+def escape_html(text: str) -> str:
+    """Escapes ``&``, ``<``, ``>``, ``"`` and ``'`` (the same as ``html.escape()``)."""
+
+    return html.escape(text)
+
+
+def escape_markdown(text: str) -> str:
+    """Escapes Markdown special characters with backslashes."""
+
+    return _MARKDOWN_SPECIAL.sub(r'\\\1', text)
+
+
+def escape_markdown_v2(text: str) -> str:
+    """Escapes special characters of Telegram Bot API ``MarkdownV2`` parse mode with backslashes."""
+
+    return _MARKDOWN_V2_SPECIAL.sub(r'\\\1', text)
+
+
+_escapers: dict[str, Callable[[str], str]] = {
+    'html': escape_html,
+    'markdown': escape_markdown,
+    'markdown_v2': escape_markdown_v2,
+}
+
+
+def register_escaper(name: str, escaper: Callable[[str], str]) -> None:
+    """
+    Registers an escaper, so it can be used in ``SLocale.escaped()`` and ``SL10n(escapers=...)``.
+
+    Built-in escapers are ``'html'``, ``'markdown'`` and ``'markdown_v2'`` (Telegram).
+
+    Parameters:
+        name (str):
+            Name of the escaper. Registering an existing name replaces that escaper
+            (escaped views already computed with it are not recomputed).
+        escaper (Callable[[str], str]):
+            Pure function that escapes a string.
+
+    Example:
+        ```python
+        register_escaper('shell', shlex.quote)
+
+        locale = l10n.locale('en')
+        locale.escaped('shell').my_key  # "'Text 1'"
+        ```
+    """
+
+    _escapers[name] = escaper
+
+
+def get_escaper(name: str) -> Callable[[str], str]:
+    """
+    Returns:
+        A registered escaper.
+
+    Raises:
+        ValueError: When there's no escaper with such a name.
+    """
+
+    try:
+        return _escapers[name]
+    except KeyError:
+        raise ValueError(f'Unknown escaper "{name}", expected one of: {", ".join(_escapers)}') from None
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, fields
-from typing import TypeVar
+from dataclasses import dataclass, fields
+import io
+from typing import ClassVar, IO, Iterator, TypeVar
 import warnings
 
+from . import UTF8
+from ._registry import restore_locale
+from .escape import get_escaper
+from .pimpl import ParsingImpl, JSONImpl
 from .warnings import UnexpectedLocaleKey
 
 
@@ -13,6 +18,12 @@ T = TypeVar('T', bound='SLocale')
 DATACLASS_PARAMS = dict(frozen=True)
 
 
+def _restore_by_value(cls: type[T], state: dict[str, str | None]) -> T:
+    locale = object.__new__(cls)
+    locale.__dict__.update(state)
+    return locale
+
+
 @dataclass(**DATACLASS_PARAMS)
 class SLocale:
     """
@@ -28,8 +39,15 @@ class SLocale:
     Sets to ``None`` if the container is a sample one.
     """
 
+    _field_names: ClassVar[tuple[str, ...]] = ('lang_code',)
+    _keys: ClassVar[tuple[str, ...]] = ()
+
     def __init_subclass__(cls, *args, **kwargs):
-        return dataclass(**DATACLASS_PARAMS)(cls)
+        cls = dataclass(**DATACLASS_PARAMS)(cls)
+        # field names are cached once per class, so exporting doesn't call fields() every time
+        cls._field_names = tuple(k.name for k in fields(cls))
+        cls._keys = tuple(k for k in cls._field_names if k not in SLocale._field_names)
+        return cls
 
     @classmethod
     def sample(cls) -> T:
@@ -72,9 +90,136 @@ class SLocale:
             locale = l10n.locale('en')
             locale_dict = locale.to_dict()  # {'lang_code': 'en', my_key_1: 'Text 1', my_key_2: 'Text 2', ...}
             ```
+
+        Note:
+            The dict is shallow: values are taken as is, without copying.
+            All of them are immutable strings anyway.
+        """
+
+        data = self.__dict__
+        return {key: data[key] for key in self._field_names}
+
+    def items(self, include_lang_code: bool = True) -> Iterator[tuple[str, str | None]]:
         """
+        Returns:
+            An iterator of ``(key, value)`` pairs of a locale container.
+
+        Parameters:
+            include_lang_code (bool, optional):
+                If ``False``, only translation keys are yielded. Defaults to ``True``.
+
+        Example:
+            ```python
+            locale = l10n.locale('en')
+            for key, value in locale.items(include_lang_code=False):
+                print(key, value)  # my_key_1 Text 1
+            ```
+        """
+
+        data = self.__dict__
+        for key in (self._field_names if include_lang_code else self._keys):
+            yield key, data[key]
+
+    def dump(self, file: IO, parsing_impl: ParsingImpl | None = None, *, include_lang_code: bool = False) -> None:
+        """
+        Saves translation keys of a locale container into a passed IO object (mostly file)
+        using a parsing implementation.
+
+        Binary IO objects (e.g. ``io.BytesIO``) are accepted too, the content is encoded in UTF-8
+        (unless the parsing implementation is a binary one, see ``ParsingImpl.binary``).
+
+        Parameters:
+            file (IO):
+                Text or binary IO object to write in.
+            parsing_impl (ParsingImpl, optional):
+                What parsing implementation to use. Defaults to ``pimpl.JSONImpl()``.
+            include_lang_code (bool, optional):
+                If ``True``, ``lang_code`` is saved as well. Defaults to ``False``.
+
+        Example:
+            ```python
+            locale = l10n.locale('en')
+            with open('bundle/en.json', 'w', encoding='utf-8') as f:
+                locale.dump(f)
+            ```
+        """
+
+        if parsing_impl is None:
+            parsing_impl = JSONImpl()
+
+        data = dict(self.items(include_lang_code))
+
+        if not parsing_impl.binary and isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+            wrapper = io.TextIOWrapper(file, encoding=UTF8, write_through=True)
+            try:
+                parsing_impl.dump(data, wrapper)
+                wrapper.flush()
+            finally:
+                wrapper.detach()
+            return
+
+        parsing_impl.dump(data, file)
+
+    def escaped(self: T, escaper: str) -> T:
+        """
+        Returns:
+            A locale container of the same class with all translation keys escaped by a registered escaper
+            (see ``sl10n.escape``). ``lang_code`` is left as is.
+
+        The escaped view is computed on first access and cached in the container,
+        so escaped strings cost as much as plain ones afterwards.
+        Use ``SL10n(escapers=...)`` to compute views at load instead.
+
+        Parameters:
+            escaper (str):
+                Name of the escaper, e.g. ``'html'``, ``'markdown'`` or ``'markdown_v2'`` (Telegram).
+
+        Raises:
+            ValueError: When there's no escaper with such a name.
+
+        Example:
+            ```python
+            locale = l10n.locale('en')
+            html_locale = locale.escaped('html')
+            html_locale.my_key_1  # 'Text &amp; 1'
+            ```
+        """
+
+        views = self.__dict__.setdefault('_sl10n_escaped', {})
+        if (view := views.get(escaper)) is None:
+            escape = get_escaper(escaper)
+            # computed twice at most when threads race, both views are equal
+            views[escaper] = view = self._replace({key: escape(value)
+                                                   for key, value in self.items(include_lang_code=False)})
+        return view
+
+    def __getstate__(self):
+        # pickled by value: only fields, without cached escaped views and SL10n references
+        data = self.__dict__
+        return {key: data[key] for key in self._field_names}
+
+    def __reduce_ex__(self, protocol):
+        # containers of SL10n(pickle_by_reference=True) are pickled as a reference to the SL10n object,
+        # language and content hash, and restored from the receiving process' copy
+        # (or from their values, if they are carried, see SL10n(pickle_fallback=True))
+        if (ref := self.__dict__.get('_sl10n_ref')) is not None:
+            registry_id, lang, digest, fallback = ref
+            return restore_locale, (registry_id, lang, digest, self._reduce_by_value(protocol) if fallback else None)
+        return self._reduce_by_value(protocol)
+
+    def _reduce_by_value(self, protocol):
+        # overridden by dynamic containers (see sl10n.usage), which can't be pickled as classes
+        return _restore_by_value, (type(self), self.__getstate__())
 
-        return asdict(self)
+    def _replace(self: T, changes: dict[str, str]) -> T:
+        # the same as dataclasses.replace(), but doesn't call __init__: matching thousands of keyword arguments
+        # is quadratic, and reading every field would count as a key usage in tracked containers.
+        # Values are shared with the original container, they are immutable strings anyway
+        data = self.__dict__
+        new = object.__new__(type(self))
+        new.__dict__.update({key: data[key] for key in self._field_names})
+        new.__dict__.update(changes)
+        return new
 
     def get(self, key: str) -> str:
         """
@@ -0,0 +1,120 @@
+"""Memory accounting of loaded locale containers (see ``SL10n.memory_report()``)."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+import sys
+from typing import Mapping
+
+from ._cache import cached_views, estimate_size
+from .locale import SLocale
+
+
+__all__ = ['MemoryReport', 'build_memory_report']
+
+
+@dataclass(frozen=True)
+class MemoryReport:
+    """Memory footprint of loaded locale containers. All sizes are in bytes."""
+
+    total: int
+    """Total size of all locale containers."""
+
+    languages: dict[str, int]
+    """
+    Size of every locale container (the container itself, its attributes dict and strings), largest first.
+    Views cached in containers (escaped ones and tracked copies) are included.
+    """
+
+    largest_keys: list[tuple[str, int]]
+    """Keys that take the most memory, summed across all languages, largest first."""
+
+    duplicates: list[tuple[str, int, int]]
+    """
+    Values duplicated across languages as ``(value, languages count, wasted size)`` tuples, most wasteful first.
+    Usually those are untranslated strings copied from the default language.
+    """
+
+    init_allocations: dict[str, int] | None = None
+    """
+    Memory allocated while loading every file in ``SL10n.init(trace_memory=True)`` (traced by ``tracemalloc``).
+    ``None`` if it wasn't traced.
+    """
+
+    def format(self, preview_length: int = 40) -> str:
+        """
+        Returns:
+            The report as a human-readable text.
+        """
+
+        def preview(value: str) -> str:
+            value = value.replace('\n', '\\n')
+            return value if len(value) <= preview_length else value[:preview_length - 3] + '...'
+
+        lines = [f'Total: {self.total} bytes', '', 'Languages:']
+        lines += [f'  {lang}: {size} bytes' for lang, size in self.languages.items()]
+        lines += ['', 'Largest keys:']
+        lines += [f'  {key}: {size} bytes' for key, size in self.largest_keys]
+        if self.duplicates:
+            lines += ['', 'Duplicated values:']
+            lines += [f'  {preview(value)!r}: {count} languages, {wasted} bytes wasted'
+                      for value, count, wasted in self.duplicates]
+        if self.init_allocations is not None:
+            lines += ['', 'Allocated at init:']
+            lines += [f'  {lang}: {size} bytes' for lang, size in self.init_allocations.items()]
+        return '\n'.join(lines)
+
+
+def build_memory_report(locales: Mapping[str, object], top: int = 10,
+                        init_allocations: dict[str, int] | None = None) -> MemoryReport:
+    """
+    Walks locale containers and builds a memory report.
+
+    Parameters:
+        locales (Mapping[str, SLocale]):
+            Locale containers mapped by their languages.
+        top (int, optional):
+            How many largest keys and duplicated values to report. Defaults to ``10``.
+        init_allocations (dict[str, int], optional):
+            Memory allocated while loading every file, if it was traced.
+    """
+
+    languages: dict[str, int] = {}
+    keys: dict[str, int] = defaultdict(int)
+    values: dict[str, list[int]] = defaultdict(list)
+
+    for lang, locale in locales.items():
+        size = sys.getsizeof(locale)
+        if (data := getattr(locale, '__dict__', None)) is not None:
+            size += sys.getsizeof(data)
+
+        seen = set()
+        for key, value in locale.items():
+            value_size = sys.getsizeof(value)
+            size += value_size
+            seen.add(id(value))
+            if key in SLocale._field_names:  # noqa
+                continue
+
+            keys[key] += value_size
+            values[value].append(id(value))
+
+        size += sum(estimate_size(view, seen) for view in cached_views(locale))
+        languages[lang] = size
+
+    duplicates = []
+    for value, ids in values.items():
+        if len(ids) > 1:
+            # equal strings can be the same object (e.g. interned), only separate copies waste memory
+            wasted = (len(set(ids)) - 1) * sys.getsizeof(value)
+            if wasted:
+                duplicates.append((value, len(ids), wasted))
+
+    return MemoryReport(
+        total=sum(languages.values()),
+        languages=dict(sorted(languages.items(), key=lambda p: p[1], reverse=True)),
+        largest_keys=sorted(keys.items(), key=lambda p: p[1], reverse=True)[:top],
+        duplicates=sorted(duplicates, key=lambda d: d[2], reverse=True)[:top],
+        init_allocations=init_allocations,
+    )
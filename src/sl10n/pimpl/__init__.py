@@ -1,2 +1,4 @@
 from .base import ParsingImpl
 from .json import *
+from .mo import *
+from .cached import *
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from os import PathLike
 from typing import Any, IO
 
+from .. import UTF8
+
 
 class ParsingImpl(ABC):
     """
@@ -11,6 +14,18 @@ class ParsingImpl(ABC):
     You can inherit from it and define your own parsing implementation for SL10n.
     """
 
+    binary: bool = False
+    """
+    Whether the parsing implementation works with binary files.
+    If ``True``, files are opened in binary mode instead of UTF-8 text mode.
+    """
+
+    redumpable: bool = True
+    """
+    Whether existing files can be rewritten by ``SL10n`` (``$redump``, undefined and unexpected keys).
+    If ``False``, files are only read (new files can still be created by ``SL10n.create_lang_file()``).
+    """
+
     @property
     @abstractmethod
     def file_ext(self) -> str:
@@ -26,6 +41,22 @@ class ParsingImpl(ABC):
 
         return NotImplemented
 
+    def open(self, path: str | PathLike, mode: str = 'r') -> IO:
+        """
+        Opens a file in a way the parsing implementation works with
+        (binary mode if ``ParsingImpl.binary`` is ``True``, UTF-8 text mode otherwise).
+
+        Parameters:
+            path (str | os.PathLike):
+                Path to the file.
+            mode (str, optional):
+                ``'r'`` for reading or ``'w'`` for writing. Defaults to ``'r'``.
+        """
+
+        if self.binary:
+            return open(path, mode + 'b')
+        return open(path, mode, encoding=UTF8)
+
     @abstractmethod
     def load(self, file: IO) -> Any:
         """
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+from pathlib import Path
+import pickle
+import tempfile
+from typing import Any, IO, TypeVar
+
+from .. import UTF8
+from .base import ParsingImpl
+
+
+__all__ = ['CachedImpl']
+
+PathLike = TypeVar('PathLike', str, os.PathLike)
+logger = logging.getLogger('sl10n')
+
+
+class CachedImpl(ParsingImpl):
+    """
+    Caching wrapper for any parsing implementation.
+
+    Parsed data is stored in a cache directory in a binary format (``pickle``) and loaded from there
+    until the file changes. Cache entries are keyed by file path, size, modification time, content digest
+    and parsing implementation identity, so any change of the file (e.g. a redump) invalidates its entry.
+
+    Useful for slow parsing implementations (e.g. YAML or TOML ones).
+
+    Entries are written into temporary files and atomically moved into place, so multiple processes
+    can share the cache directory and start at the same time. If the cache directory can't be written,
+    files are just parsed every time.
+
+    Warning:
+        Cache entries are unpickled, so the cache directory must be trusted:
+        anyone who can write into it can execute code in your process.
+
+    Example:
+        ```python
+        l10n = sl10n.SL10n(MyLocale, parsing_impl=CachedImpl(MyYAMLImpl(), '.sl10n_cache'))
+        ```
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(self, impl: ParsingImpl, cache_dir: Path | PathLike, *, impl_id: str | None = None):
+        """
+        Parameters:
+            impl (ParsingImpl):
+                Parsing implementation to cache results of.
+            cache_dir (str | os.PathLike | pathlib.Path):
+                Path to the cache directory. Created if it doesn't exist. Must be writable only by trusted users.
+            impl_id (str, optional):
+                Identity of the parsing implementation, used in cache keys.
+                Defaults to its class path and its module name, if it has one (e.g. ``JSONImpl``).
+        """
+
+        self.impl = impl
+        self.cache_dir = Path(cache_dir)
+
+        if impl_id is None:
+            impl_id = f'{type(impl).__module__}.{type(impl).__qualname__}'
+            if (module := getattr(impl, 'module', None)) is not None:
+                impl_id += f':{getattr(module, "__name__", module)}'
+        self.impl_id = impl_id
+
+    @property
+    def file_ext(self) -> str:
+        return self.impl.file_ext
+
+    @property
+    def binary(self) -> bool:
+        return self.impl.binary
+
+    @property
+    def redumpable(self) -> bool:
+        return self.impl.redumpable
+
+    def load(self, file: IO) -> Any:
+        content = file.read()
+        raw = content.encode(UTF8) if isinstance(content, str) else content
+        path = self._path_of(file)
+
+        try:
+            stat = os.fstat(file.fileno())
+            size, mtime = stat.st_size, stat.st_mtime_ns
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            size, mtime = len(raw), None
+
+        digest = hashlib.blake2b(raw).hexdigest()
+        key = (self.CACHE_VERSION, self.impl_id, path, size, mtime, digest)
+        entry = self._entry_path(path if path is not None else digest)
+
+        try:
+            with open(entry, 'rb') as f:
+                cached_key, data = pickle.load(f)
+            if cached_key == key:
+                return data
+        except (OSError, EOFError, ValueError, pickle.UnpicklingError):
+            pass
+
+        data = self.impl.load(io.StringIO(content) if isinstance(content, str) else io.BytesIO(content))
+
+        try:
+            self._write_entry(entry, (key, data))
+        except OSError as e:  # the file is parsed anyway, caching is best-effort
+            logger.debug(f'Can\'t write cache entry {entry}: {e}')
+        return data
+
+    def _write_entry(self, entry: Path, value: Any) -> None:
+        # readers must never see a half-written entry, so it's moved into place only when it's complete
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=f'{entry.stem}.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump(value, f, pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def dump(self, data: Any, file: IO) -> None:
+        # no need to touch the cache: the content digest changes, so the entry is rewritten on the next load
+        self.impl.dump(data, file)
+
+    @staticmethod
+    def _path_of(file: IO) -> str | None:
+        name = getattr(file, 'name', None)
+        if isinstance(name, (str, os.PathLike)):
+            return os.path.abspath(name)
+        return None
+
+    def _entry_path(self, source: str) -> Path:
+        name = hashlib.blake2b(f'{self.impl_id}\0{source}'.encode(UTF8), digest_size=16).hexdigest()
+        return self.cache_dir / f'{name}.cache'
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from array import array
+from itertools import accumulate
+import re
+import struct
+import sys
+from typing import Any, IO
+
+from .base import ParsingImpl
+
+
+__all__ = ['MOImpl']
+
+
+class MOImpl(ParsingImpl):
+    """
+    Interface for compiled gettext catalogs (".mo" files).
+
+    Catalogs are read straight from the binary: message ids become keys and translations become values.
+    For plural messages the first form is used, message contexts are kept in keys as is (``context\\x04msgid``).
+
+    Dumping writes a valid catalog without a hash table (like ``msgfmt --no-hash``),
+    so ``SL10n.create_lang_file()`` works as well.
+
+    Existing catalogs are never redumped: they are usually shared with other gettext users,
+    and a redump would lose the header (e.g. ``Plural-Forms``), other plural forms and entries
+    the locale container doesn't define.
+    """
+
+    file_ext = 'mo'
+    """Accepts ".mo" files."""
+
+    binary = True
+    redumpable = False
+
+    MAGIC = 0x950412de
+    _charset_re = re.compile(rb'charset=([\w-]+)', re.IGNORECASE)
+
+    def load(self, file: IO) -> Any:
+        buf = file.read()
+
+        magic, = struct.unpack_from('<I', buf)
+        if magic == self.MAGIC:
+            byteorder = '<'
+        elif magic == int.from_bytes(self.MAGIC.to_bytes(4, 'little'), 'big'):
+            byteorder = '>'
+        else:
+            raise ValueError(f'"{getattr(file, "name", file)}" is not a gettext catalog.')
+
+        _, count, originals_offset, translations_offset = struct.unpack_from(byteorder + '4I', buf, 4)
+
+        # both tables are arrays of (length, offset) pairs
+        originals = self._table(buf, originals_offset, count, byteorder)
+        translations = self._table(buf, translations_offset, count, byteorder)
+
+        encoding = 'utf-8'
+        if count and originals[0] == 0:  # catalog header (empty msgid) goes first
+            length, offset = translations[0], translations[1]
+            if (match := self._charset_re.search(buf, offset, offset + length)) is not None:
+                encoding = match.group(1).decode('ascii')
+
+        # fast path: strings are stored one after another (that's how msgfmt and MOImpl write them),
+        # so every table is decoded at once instead of string by string
+        msgids = self._contiguous_strings(buf, originals, count, encoding)
+        msgstrs = self._contiguous_strings(buf, translations, count, encoding) if msgids is not None else None
+        if msgstrs is not None:
+            data = dict(zip(msgids, msgstrs))
+            data.pop('', None)
+            return data
+
+        data = {}
+        for i in range(0, count * 2, 2):
+            length, offset = originals[i], originals[i + 1]
+            msgid = buf[offset:offset + length]
+            length, offset = translations[i], translations[i + 1]
+            msgstr = buf[offset:offset + length]
+
+            if not msgid:  # catalog header
+                continue
+
+            if b'\x00' in msgid:  # plural forms
+                msgid = msgid.split(b'\x00', 1)[0]
+                msgstr = msgstr.split(b'\x00', 1)[0]
+
+            data[msgid.decode(encoding)] = msgstr.decode(encoding)
+
+        return data
+
+    def dump(self, data: Any, file: IO) -> None:
+        messages = {'': 'Content-Type: text/plain; charset=UTF-8\n'}
+        for key, value in data.items():
+            if isinstance(value, list):
+                value = '\n'.join(value)
+            messages[key] = value if isinstance(value, str) else str(value)
+
+        keys = sorted(messages)  # gettext expects sorted message ids
+        ids = [k.encode('utf-8') for k in keys]
+        strs = [messages[k].encode('utf-8') for k in keys]
+
+        header_size = 7 * 4
+        originals_offset = header_size
+        translations_offset = originals_offset + len(keys) * 8
+        ids_offset = translations_offset + len(keys) * 8
+        strs_offset = ids_offset + sum(len(s) + 1 for s in ids)
+
+        table = []
+        offset = ids_offset
+        for s in ids:
+            table += [len(s), offset]
+            offset += len(s) + 1
+        offset = strs_offset
+        for s in strs:
+            table += [len(s), offset]
+            offset += len(s) + 1
+
+        file.write(struct.pack('<7I', self.MAGIC, 0, len(keys), originals_offset, translations_offset, 0, 0))
+        file.write(struct.pack(f'<{len(table)}I', *table))
+        file.write(b''.join(s + b'\x00' for s in ids))
+        file.write(b''.join(s + b'\x00' for s in strs))
+
+    @staticmethod
+    def _contiguous_strings(buf: bytes, table: array, count: int, encoding: str) -> list[str] | None:
+        if not count:
+            return []
+
+        lengths, offsets = table[0::2], table[1::2]
+        start, end = offsets[0], offsets[-1] + lengths[-1]
+
+        # every check is done in C: the strings must be separated by single NULs and contain no NULs themselves
+        # (plural forms do), otherwise the caller falls back to the slow path
+        expected_offsets = array('I', accumulate(map((1).__add__, lengths[:-1]), initial=start))
+        if expected_offsets != offsets:
+            return None
+
+        strings = buf[start:end].decode(encoding).split('\x00')
+        if len(strings) != count:
+            return None
+
+        return strings
+
+    @staticmethod
+    def _table(buf: bytes, offset: int, count: int, byteorder: str) -> array:
+        table = array('I')
+        table.frombytes(buf[offset:offset + count * 8])
+        if (byteorder == '<') != (sys.byteorder == 'little'):
+            table.byteswap()
+        return table
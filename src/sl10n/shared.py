@@ -0,0 +1,293 @@
+"""Read-only locale store in shared memory, so multiple processes can use the same locales without loading them."""
+
+from __future__ import annotations
+
+import json
+from multiprocessing import resource_tracker, shared_memory
+import struct
+import sys
+import threading
+from typing import Iterator, Mapping
+import warnings
+import weakref
+
+from . import UTF8
+from .escape import get_escaper
+from .locale import SLocale
+from .warnings import UnexpectedLocaleKey
+
+
+__all__ = ['SharedLocaleStore', 'SharedLocale', 'EscapedLocale']
+
+_tracker_patch_lock = threading.Lock()
+
+
+class SharedLocaleStore:
+    """
+    Locales packed into a ``multiprocessing.shared_memory`` segment.
+
+    The segment consists of a header, a table of string offsets and a blob of UTF-8 encoded strings.
+    Strings are decoded straight from the segment on access, so processes attached to it
+    don't parse any files and don't hold their own copies of locales.
+
+    Usually you don't need to use it directly, see ``SL10n.share()`` and ``SL10n.attach()``.
+
+    Warning:
+        The process that created the store owns the segment: it must keep the store alive
+        while other processes use it and call ``SharedLocaleStore.unlink()`` when it's done.
+    """
+
+    MAGIC = b'SL10'
+    _header = struct.Struct('=4sIII')  # magic, metadata size, langs count, keys count
+    _offset = struct.Struct('=I')
+
+    def __init__(self, shm: shared_memory.SharedMemory):
+        self._shm = shm
+
+        magic, meta_size, langs_count, keys_count = self._header.unpack_from(shm.buf)
+        if magic != self.MAGIC:
+            raise ValueError(f'Shared memory segment "{shm.name}" doesn\'t contain sl10n locales.')
+
+        meta_start = self._header.size
+        meta = json.loads(bytes(shm.buf[meta_start:meta_start + meta_size]).decode(UTF8))
+
+        self.langs: tuple[str, ...] = tuple(meta['langs'])
+        self.keys: tuple[str, ...] = tuple(meta['keys'])
+        self._key_index = {key: i for i, key in enumerate(self.keys)}
+
+        offsets_start = self._align(meta_start + meta_size)
+        offsets_count = langs_count * keys_count + 1
+        self._blob_start = offsets_start + offsets_count * self._offset.size
+        self._offsets = shm.buf[offsets_start:self._blob_start].cast(self._offset.format[-1])
+        # the segment can't be closed while the offsets table is exported, so it's released first,
+        # even if the store is just garbage collected or the interpreter exits
+        self._finalizer = weakref.finalize(self, self._release, self._offsets, shm)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory segment. Pass it into ``SL10n.attach()`` in other processes."""
+
+        return self._shm.name
+
+    @staticmethod
+    def _align(offset: int) -> int:
+        return (offset + 7) & ~7
+
+    @classmethod
+    def create(cls, locales: Mapping[str, SLocale], keys: tuple[str, ...],
+               name: str | None = None) -> SharedLocaleStore:
+        """
+        Packs locales into a new shared memory segment.
+
+        Parameters:
+            locales (Mapping[str, SLocale]):
+                Locale containers to pack, mapped by their access keys.
+            keys (tuple[str, ...]):
+                Field names of locale containers (including ``lang_code``).
+            name (str, optional):
+                Name of the segment. Generated by the system if not set.
+        """
+
+        strings = []
+        offsets = [0]
+        for locale in locales.values():
+            for key in keys:
+                encoded = getattr(locale, key).encode(UTF8)
+                strings.append(encoded)
+                offsets.append(offsets[-1] + len(encoded))
+
+        meta = json.dumps({'langs': list(locales), 'keys': list(keys)}).encode(UTF8)
+        offsets_start = cls._align(cls._header.size + len(meta))
+        blob_start = offsets_start + len(offsets) * cls._offset.size
+        size = blob_start + offsets[-1]
+
+        shm = shared_memory.SharedMemory(name, create=True, size=max(size, 1))
+        try:
+            buf = shm.buf
+            cls._header.pack_into(buf, 0, cls.MAGIC, len(meta), len(locales), len(keys))
+            buf[cls._header.size:cls._header.size + len(meta)] = meta
+            struct.pack_into(f'={len(offsets)}{cls._offset.format[-1]}', buf, offsets_start, *offsets)
+            buf[blob_start:size] = b''.join(strings)
+            del buf
+        except BaseException:
+            shm.close()
+            shm.unlink()
+            raise
+
+        return cls(shm)
+
+    @classmethod
+    def attach(cls, name: str) -> SharedLocaleStore:
+        """
+        Attaches to an existing shared memory segment by its name.
+
+        Parameters:
+            name (str):
+                Name of the segment.
+        """
+
+        if sys.version_info >= (3, 13):
+            return cls(shared_memory.SharedMemory(name, track=False))
+        return cls(cls._open_untracked(name))
+
+    @staticmethod
+    def _open_untracked(name: str) -> shared_memory.SharedMemory:
+        # before 3.13 SharedMemory always registers the segment in the resource tracker, which would destroy it
+        # when this process exits. Unregistering it afterwards isn't an option: processes started by the owner
+        # with multiprocessing share its tracker, so that would drop the owner's registration too.
+        # The patch is process-wide while the segment is opened, so it skips only this segment:
+        # other resources (e.g. segments created by other threads meanwhile) are registered as usual
+        register = resource_tracker.register
+        skipped = {name, '/' + name.lstrip('/')}
+
+        def register_untracked(resource, rtype):
+            if rtype != 'shared_memory' or resource not in skipped:
+                register(resource, rtype)
+
+        with _tracker_patch_lock:
+            resource_tracker.register = register_untracked
+            try:
+                return shared_memory.SharedMemory(name)
+            finally:
+                resource_tracker.register = register
+
+    def read(self, lang_index: int, key_index: int) -> str:
+        """Decodes a string straight from the segment."""
+
+        i = lang_index * len(self.keys) + key_index
+        start, end = self._blob_start + self._offsets[i], self._blob_start + self._offsets[i + 1]
+        return str(self._shm.buf[start:end], UTF8)
+
+    def view(self, lang: str) -> SharedLocale:
+        """Returns a read-only locale view for a requested language."""
+
+        return SharedLocale(self, self.langs.index(lang))
+
+    def views(self) -> dict[str, SharedLocale]:
+        """Returns read-only locale views for all languages, mapped by their access keys."""
+
+        return {lang: SharedLocale(self, i) for i, lang in enumerate(self.langs)}
+
+    @staticmethod
+    def _release(offsets: memoryview, shm: shared_memory.SharedMemory) -> None:
+        offsets.release()
+        shm.close()
+
+    def close(self) -> None:
+        """
+        Detaches from the segment. Views become unusable after that.
+
+        It's also done automatically when the store is garbage collected or the interpreter exits.
+        """
+
+        self._finalizer()
+
+    def unlink(self) -> None:
+        """Destroys the segment. Should be called only by the process that created it."""
+
+        self._shm.unlink()
+
+
+class SharedLocale:
+    """
+    Read-only view of a locale in ``SharedLocaleStore``.
+
+    Behaves like a locale container: keys are accessed as attributes
+    and it supports ``get()``, ``items()``, ``to_dict()``, ``dump()`` and ``escaped()``.
+    """
+
+    __slots__ = ('_store', '_lang_index', '_escaped')
+
+    dump = SLocale.dump
+
+    def __init__(self, store: SharedLocaleStore, lang_index: int):
+        self._store = store
+        self._lang_index = lang_index
+        self._escaped: dict[str, EscapedLocale] = {}
+
+    def __getattr__(self, key: str) -> str:
+        if key.startswith('_'):  # unset slots (e.g. in copy.copy()), keys never start with "_"
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {key!r}')
+        try:
+            key_index = self._store._key_index[key]  # noqa
+        except KeyError:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {key!r}') from None
+        return self._store.read(self._lang_index, key_index)
+
+    def __setattr__(self, key, value):
+        if key in self.__slots__:
+            return object.__setattr__(self, key, value)
+        raise AttributeError(f'{self.__class__.__name__!r} object is read-only')
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(lang_code={self.lang_code!r})'
+
+    def __reduce__(self):
+        raise TypeError(f'Can\'t pickle or copy {self.__class__.__name__}: it\'s a view of shared memory, '
+                        f'use to_dict() to get its strings.')
+
+    def get(self, key: str) -> str:
+        """The same as ``SLocale.get()``."""
+
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            warnings.warn(f'Got unexpected key "{key}", returned the key', UnexpectedLocaleKey, stacklevel=2)
+            return key
+
+    def items(self, include_lang_code: bool = True) -> Iterator[tuple[str, str]]:
+        """The same as ``SLocale.items()``."""
+
+        for i, key in enumerate(self._store.keys):
+            if include_lang_code or key not in SLocale._field_names:  # noqa
+                yield key, self._store.read(self._lang_index, i)
+
+    def to_dict(self) -> dict[str, str]:
+        """The same as ``SLocale.to_dict()``."""
+
+        return dict(self.items())
+
+    def escaped(self, escaper: str) -> EscapedLocale:
+        """
+        The same as ``SLocale.escaped()``, but escaped strings are kept in this process
+        (see ``EscapedLocale``), not in shared memory.
+        """
+
+        if (view := self._escaped.get(escaper)) is None:
+            escape = get_escaper(escaper)
+            values = {key: value if key in SLocale._field_names else escape(value)  # noqa
+                      for key, value in self.items()}
+            self._escaped[escaper] = view = EscapedLocale(values)
+        return view
+
+
+class EscapedLocale(SharedLocale):
+    """
+    Read-only escaped view of a ``SharedLocale`` (see ``SharedLocale.escaped()``).
+
+    Strings are kept in a dict of this process, so reading them doesn't decode anything.
+    """
+
+    __slots__ = ('_values',)
+
+    def __init__(self, values: dict[str, str]):  # noqa
+        object.__setattr__(self, '_values', values)
+        object.__setattr__(self, '_escaped', {})
+
+    def __getattr__(self, key: str) -> str:
+        if key.startswith('_'):
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {key!r}')
+        try:
+            return self._values[key]
+        except KeyError:
+            raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {key!r}') from None
+
+    def __reduce__(self):
+        return self.__class__, (self._values,)
+
+    def items(self, include_lang_code: bool = True) -> Iterator[tuple[str, str]]:
+        """The same as ``SLocale.items()``."""
+
+        for key, value in self._values.items():
+            if include_lang_code or key not in SLocale._field_names:  # noqa
+                yield key, value
@@ -0,0 +1,327 @@
+"""Storage backends: where ``SL10n`` reads translations from (a directory, a zip archive, a SQLite database)."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+import io
+import json
+import logging
+import os
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Iterable, TypeVar
+import zipfile
+
+from . import UTF8
+from .pimpl import ParsingImpl
+
+
+__all__ = ['Storage', 'DirectoryStorage', 'ResourceStorage', 'ZipStorage', 'SQLiteStorage']
+
+PathLike = TypeVar('PathLike', str, os.PathLike)
+logger = logging.getLogger('sl10n')
+
+
+class Storage(ABC):
+    """
+    Interface for translation storages.
+
+    ``SL10n`` uses ``DirectoryStorage`` by default.
+    You can inherit from it and define your own storage for SL10n.
+    """
+
+    read_only: bool = False
+    """If ``True``, files are never redumped and ``SL10n.create_lang_file()`` can't be used."""
+
+    @property
+    def redumpable(self) -> bool:
+        """If ``False``, existing files are never redumped (see ``ParsingImpl.redumpable``)."""
+
+        return not self.read_only
+
+    @abstractmethod
+    def langs(self) -> list[str]:
+        """
+        Returns:
+            All languages available in the storage.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, lang: str) -> bool:
+        """
+        Returns:
+            Whether the language is available in the storage.
+        """
+
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, lang: str) -> Any:
+        """
+        Loads and returns translations of a requested language (the same data ``ParsingImpl.load()`` returns).
+        """
+
+        raise NotImplementedError
+
+    def dump(self, lang: str, data: Any) -> None:
+        """
+        Saves translations of a requested language.
+
+        Raises:
+            PermissionError: When the storage is read-only.
+        """
+
+        raise PermissionError(f'{self.__class__.__name__} is read-only.')
+
+    def location(self, lang: str) -> str:
+        """
+        Returns:
+            Human-readable location of a requested language (used in warnings and logs).
+        """
+
+        return lang
+
+    def identity(self) -> str:
+        """
+        Returns:
+            A string identifying the storage, the same in every process using it
+            (e.g. an absolute path, used to pickle ``SL10n`` by reference). Defaults to the storage class path.
+        """
+
+        return f'{type(self).__module__}.{type(self).__qualname__}'
+
+
+class DirectoryStorage(Storage):
+    """Translation files in a directory, one file per language (``<lang>.<ParsingImpl.file_ext>``)."""
+
+    def __init__(self, path: Path | PathLike, parsing_impl: ParsingImpl):
+        """
+        Parameters:
+            path (str | os.PathLike | pathlib.Path):
+                Path to your translation files directory.
+            parsing_impl (ParsingImpl):
+                What parsing implementation to use.
+        """
+
+        self.path = Path(path)
+        self.parsing_impl = parsing_impl
+
+    @property
+    def redumpable(self) -> bool:
+        return not self.read_only and self.parsing_impl.redumpable
+
+    def file(self, lang: str) -> Path:
+        return self.path / f'{lang}.{self.parsing_impl.file_ext}'
+
+    def langs(self) -> list[str]:
+        return [file.stem for file in self.path.glob(f'*.{self.parsing_impl.file_ext}')]
+
+    def exists(self, lang: str) -> bool:
+        return self.file(lang).exists()
+
+    def load(self, lang: str) -> Any:
+        with self.parsing_impl.open(self.file(lang)) as f:
+            return self.parsing_impl.load(f)
+
+    def dump(self, lang: str, data: Any) -> None:
+        if not self.path.exists():
+            self.path.mkdir(parents=True)
+
+        with self.parsing_impl.open(self.file(lang), 'w') as f:
+            self.parsing_impl.dump(data, f)
+
+    def location(self, lang: str) -> str:
+        return str(self.file(lang))
+
+    def identity(self) -> str:
+        return f'{os.path.abspath(self.path)}/*.{self.parsing_impl.file_ext}'
+
+
+class ResourceStorage(Storage):
+    """
+    Read-only translation files in a ``importlib.resources`` traversable directory,
+    one file per language (``<lang>.<ParsingImpl.file_ext>``).
+
+    Allows shipping translations inside wheels and zipapps.
+
+    Example:
+        ```python
+        from importlib.resources import files
+
+        l10n = sl10n.SL10n(MyLocale, storage=ResourceStorage(files('my_package') / 'lang', pimpl.JSONImpl()))
+        ```
+    """
+
+    read_only = True
+
+    def __init__(self, root: Any, parsing_impl: ParsingImpl):
+        """
+        Parameters:
+            root (importlib.abc.Traversable):
+                Directory containing translation files.
+            parsing_impl (ParsingImpl):
+                What parsing implementation to use.
+        """
+
+        self.root = root
+        self.parsing_impl = parsing_impl
+        self._suffix = f'.{parsing_impl.file_ext}'
+
+    def langs(self) -> list[str]:
+        return [entry.name[:-len(self._suffix)] for entry in self.root.iterdir()
+                if entry.name.endswith(self._suffix) and entry.is_file()]
+
+    def exists(self, lang: str) -> bool:
+        return (self.root / f'{lang}{self._suffix}').is_file()
+
+    def load(self, lang: str) -> Any:
+        # zipfile.Path.open() accepts only "r" and "w" modes before Python 3.9
+        f = io.BytesIO((self.root / f'{lang}{self._suffix}').read_bytes())
+        if self.parsing_impl.binary:
+            return self.parsing_impl.load(f)
+        return self.parsing_impl.load(io.TextIOWrapper(f, encoding=UTF8))
+
+    def location(self, lang: str) -> str:
+        return str(self.root / f'{lang}{self._suffix}')
+
+    def identity(self) -> str:
+        return f'{self.root}/*{self._suffix}'
+
+
+class ZipStorage(ResourceStorage):
+    """
+    Read-only translation files in a single zip archive, one file per language (``<lang>.<ParsingImpl.file_ext>``).
+
+    Reading a single archive avoids a lot of filesystem metadata operations,
+    which are slow on network and overlay filesystems.
+
+    Example:
+        ```python
+        l10n = sl10n.SL10n(MyLocale, storage=ZipStorage('lang.zip', pimpl.JSONImpl()))
+        ```
+    """
+
+    def __init__(self, path: Path | PathLike, parsing_impl: ParsingImpl, at: str = ''):
+        """
+        Parameters:
+            path (str | os.PathLike | pathlib.Path):
+                Path to the zip archive.
+            parsing_impl (ParsingImpl):
+                What parsing implementation to use.
+            at (str, optional):
+                Directory inside the archive containing translation files. Defaults to the archive root.
+        """
+
+        if at and not at.endswith('/'):
+            at += '/'
+        super().__init__(zipfile.Path(path, at), parsing_impl)
+        self._archive = os.path.abspath(path)
+        self._at = at
+
+    def identity(self) -> str:
+        return f'{self._archive}/{self._at}*{self._suffix}'
+
+
+class SQLiteStorage(Storage):
+    """
+    Translations in a SQLite database, one row per language and key.
+
+    Rows are indexed by language and key, so a language (or a single key) is read without scanning the whole database.
+
+    Example:
+        ```python
+        storage = SQLiteStorage('lang.sqlite3')
+        storage.copy_from(DirectoryStorage('lang', pimpl.JSONImpl()))  # e.g. at build time
+
+        l10n = sl10n.SL10n(MyLocale, storage=storage, only_langs=['en', 'de']).init()
+        ```
+    """
+
+    TABLE = 'sl10n_translations'
+
+    def __init__(self, path: Path | PathLike, *, read_only: bool = False):
+        """
+        Parameters:
+            path (str | os.PathLike | pathlib.Path):
+                Path to the database. Created if it doesn't exist (unless ``read_only`` is ``True``).
+            read_only (bool, optional):
+                If ``True``, the database is opened in read-only mode. Defaults to ``False``.
+        """
+
+        self.path = Path(path)
+        self.read_only = read_only
+
+        if read_only:
+            self._connection = sqlite3.connect(f'{self.path.absolute().as_uri()}?mode=ro', uri=True,
+                                               check_same_thread=False)
+        else:
+            self._connection = sqlite3.connect(self.path, check_same_thread=False)
+            self._connection.execute(f'CREATE TABLE IF NOT EXISTS {self.TABLE} '
+                                     f'(lang TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, '
+                                     f'PRIMARY KEY (lang, key)) WITHOUT ROWID')
+            self._connection.commit()
+        self._lock = threading.Lock()
+
+    def _query(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    def langs(self) -> list[str]:
+        return [lang for lang, in self._query(f'SELECT DISTINCT lang FROM {self.TABLE}')]
+
+    def exists(self, lang: str) -> bool:
+        return bool(self._query(f'SELECT 1 FROM {self.TABLE} WHERE lang = ? LIMIT 1', (lang,)))
+
+    def load(self, lang: str) -> Any:
+        # values are stored as JSON, so lists (multiline strings) and modifiers keep their types
+        return {key: json.loads(value)
+                for key, value in self._query(f'SELECT key, value FROM {self.TABLE} WHERE lang = ?', (lang,))}
+
+    def get(self, lang: str, key: str) -> Any | None:
+        """
+        Reads a single key of a requested language.
+
+        Returns:
+            The value or ``None`` if there's no such key.
+        """
+
+        rows = self._query(f'SELECT value FROM {self.TABLE} WHERE lang = ? AND key = ?', (lang, key))
+        return json.loads(rows[0][0]) if rows else None
+
+    def dump(self, lang: str, data: Any) -> None:
+        if self.read_only:
+            super().dump(lang, data)
+
+        rows = [(lang, key, json.dumps(value, ensure_ascii=False)) for key, value in data.items()]
+        with self._lock, self._connection:
+            self._connection.execute(f'DELETE FROM {self.TABLE} WHERE lang = ?', (lang,))
+            self._connection.executemany(f'INSERT INTO {self.TABLE} (lang, key, value) VALUES (?, ?, ?)', rows)
+
+    def copy_from(self, storage: Storage, langs: Iterable[str] | None = None) -> None:
+        """
+        Copies translations from another storage.
+
+        Parameters:
+            storage (Storage):
+                Storage to copy from.
+            langs (Iterable[str], optional):
+                Languages to copy. Defaults to all languages of the storage.
+        """
+
+        for lang in (storage.langs() if langs is None else langs):
+            logger.debug(f'Copying {storage.location(lang)}...')
+            self.dump(lang, storage.load(lang))
+
+    def location(self, lang: str) -> str:
+        return f'{self.path}:{lang}'
+
+    def identity(self) -> str:
+        return os.path.abspath(self.path)
+
+    def close(self) -> None:
+        """Closes the database connection."""
+
+        self._connection.close()
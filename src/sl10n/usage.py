@@ -0,0 +1,227 @@
+"""Runtime key usage tracking and pruned locale containers."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import random
+import threading
+import types
+from typing import Iterable, Type, TypeVar
+
+from . import UTF8
+from .locale import SLocale
+
+
+__all__ = ['UsageTracker', 'pruned_container']
+
+T = TypeVar('T', bound=SLocale)
+PathLike = TypeVar('PathLike', str, os.PathLike)
+
+# pruned containers are cached, so unpickled locales get the same class
+_pruned_containers: dict[tuple[type, frozenset[str]], Type[SLocale]] = {}
+
+
+class UsageTracker:
+    """
+    Records what keys are read from locale containers (via attribute access and ``SLocale.get()``)
+    for every language.
+
+    Pass it into ``SL10n(track_usage=...)`` and save the results with ``UsageTracker.save()``.
+    Later, the saved keys can be used to load only them (see ``SL10n(only_keys=...)``).
+
+    Example:
+        ```python
+        tracker = UsageTracker(sample_rate=0.1)
+        l10n = sl10n.SL10n(MyLocale, track_usage=tracker).init()
+        ...
+        tracker.save('lang_usage.json')
+
+        # later, in a service that uses only a slice of the schema
+        l10n = sl10n.SL10n(MyLocale, only_keys=UsageTracker.load('lang_usage.json').keys()).init()
+        ```
+
+    Note:
+        Tracked containers are dynamic subclasses of your locale container, so their type is not your locale
+        container itself (``isinstance()`` checks still work). They are pickled as plain locale containers.
+    """
+
+    def __init__(self, sample_rate: float = 1.0):
+        """
+        Parameters:
+            sample_rate (float, optional):
+                Fraction of ``SL10n.locale()`` calls that return a tracked container, from ``0.0`` to ``1.0``
+                (other calls return plain containers, reading them costs nothing extra).
+                Lower values make tracking cheaper, but rarely used keys may be missed. Defaults to ``1.0``.
+        """
+
+        self.sample_rate = sample_rate
+        self._used: dict[str, set[str]] = {}
+        self._lock = threading.Lock()
+        self._tracked_containers: dict[type, type] = {}
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1.0 or random.random() < self.sample_rate
+
+    def record(self, lang: str | None, key: str) -> None:
+        """Records a key read in a requested language (a ``sample_rate`` fraction of calls is recorded)."""
+
+        if self._sampled():
+            self._record(lang, key)
+
+    def _record(self, lang: str | None, key: str) -> None:
+        if (used := self._used.get(lang)) is not None and key in used:
+            return
+        with self._lock:
+            self._used.setdefault(lang, set()).add(key)
+
+    def sample(self, locale: T) -> T:
+        """
+        Returns:
+            A tracked copy of the locale container for a ``sample_rate`` fraction of calls,
+            the locale container itself otherwise. ``SL10n.locale()`` calls it for every lookup.
+
+        Tracked copies are cached in locale containers, strings are shared with them.
+        Containers that are not ``SLocale`` instances (e.g. attached from shared memory) are never tracked.
+        """
+
+        if (self.sample_rate < 1.0 and random.random() >= self.sample_rate) or not isinstance(locale, SLocale):
+            return locale
+
+        data = locale.__dict__
+        if (cached := data.get('_sl10n_tracked')) is not None and cached[0] is self:
+            return cached[1]
+
+        tracked = object.__new__(self.track(type(locale)))
+        tracked.__dict__.update({key: data[key] for key in locale._field_names})  # noqa
+        if (ref := data.get('_sl10n_ref')) is not None:  # pickled by reference as the original one
+            tracked.__dict__['_sl10n_ref'] = ref
+        data['_sl10n_tracked'] = (self, tracked)
+        return tracked
+
+    def used(self) -> dict[str, set[str]]:
+        """
+        Returns:
+            Recorded keys mapped by languages.
+        """
+
+        with self._lock:
+            return {lang: set(keys) for lang, keys in self._used.items()}
+
+    def keys(self) -> set[str]:
+        """
+        Returns:
+            Keys recorded in any language.
+        """
+
+        return set().union(*self.used().values())
+
+    def save(self, path: Path | PathLike, merge: bool = True) -> None:
+        """
+        Saves recorded keys into a JSON file.
+
+        Parameters:
+            path (str | os.PathLike | pathlib.Path):
+                Path to the usage file.
+            merge (bool, optional):
+                If ``True``, keys already saved in the file are kept. Defaults to ``True``.
+        """
+
+        used = self.used()
+        if merge and os.path.exists(path):
+            for lang, keys in self.load(path).used().items():
+                used.setdefault(lang, set()).update(keys)
+
+        with open(path, 'w', encoding=UTF8) as f:
+            json.dump({str(lang): sorted(keys) for lang, keys in used.items()}, f, indent=2, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path: Path | PathLike) -> UsageTracker:
+        """
+        Loads recorded keys from a JSON file.
+
+        Parameters:
+            path (str | os.PathLike | pathlib.Path):
+                Path to the usage file.
+        """
+
+        with open(path, encoding=UTF8) as f:
+            data = json.load(f)
+
+        tracker = cls()
+        tracker._used = {lang: set(keys) for lang, keys in data.items()}
+        return tracker
+
+    def track(self, locale_container: Type[T]) -> Type[T]:
+        """
+        Returns:
+            A subclass of the locale container which records key reads into this tracker.
+        """
+
+        if (tracked := self._tracked_containers.get(locale_container)) is not None:
+            return tracked
+
+        keys = frozenset(locale_container._keys)  # noqa
+        record = self._record
+        getattribute = object.__getattribute__
+
+        def __getattribute__(self, name):
+            if name in keys:
+                record(getattribute(self, 'lang_code'), name)
+            return getattribute(self, name)
+
+        def _reduce_by_value(self, protocol):
+            # pickled as an untracked container: tracked classes exist only in the process that created them
+            untracked = object.__new__(locale_container)
+            untracked.__dict__.update(self.__getstate__())
+            return untracked._reduce_by_value(protocol)  # noqa
+
+        tracked = types.new_class(locale_container.__name__, (locale_container,),
+                                  exec_body=lambda ns: ns.update(__getattribute__=__getattribute__,
+                                                                 _reduce_by_value=_reduce_by_value,
+                                                                 __module__=locale_container.__module__,
+                                                                 __qualname__=f'{locale_container.__qualname__}'
+                                                                              f'[tracked]'))
+        self._tracked_containers[locale_container] = tracked
+        return tracked
+
+
+def pruned_container(locale_container: Type[T], keys: Iterable[str]) -> Type[SLocale]:
+    """
+    Returns:
+        A locale container with only requested keys of the passed one.
+
+    Raises:
+        ValueError: When some of the keys are not defined in the locale container.
+
+    Note:
+        A pruned container is not a subclass of the original one.
+        Reading keys that were pruned raises ``AttributeError``.
+    """
+
+    keys = frozenset(keys)
+    if (pruned := _pruned_containers.get((locale_container, keys))) is not None:
+        return pruned
+
+    if unknown_keys := keys - set(locale_container._keys):  # noqa
+        raise ValueError(f'Keys {", ".join(sorted(unknown_keys))} are not defined in {locale_container.__name__}.')
+
+    annotations = {key: str for key in locale_container._keys if key in keys}  # noqa
+
+    def _reduce_by_value(self, protocol):
+        return _restore_pruned, (locale_container, keys, self.__getstate__())
+
+    pruned = types.new_class(locale_container.__name__, (SLocale,),
+                             exec_body=lambda ns: ns.update(__annotations__=annotations,
+                                                            _reduce_by_value=_reduce_by_value,
+                                                            __module__=locale_container.__module__,
+                                                            __qualname__=f'{locale_container.__qualname__}[pruned]'))
+    _pruned_containers[locale_container, keys] = pruned
+    return pruned
+
+
+def _restore_pruned(locale_container: Type[T], keys: frozenset[str], state: dict[str, str]) -> SLocale:
+    locale = object.__new__(pruned_container(locale_container, keys))
+    locale.__dict__.update(state)
+    return locale
@@ -0,0 +1,66 @@
+import gzip
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from sl10n import SL10n, bundle
+from sl10n.bundle import BundleExporter
+
+from . import *
+
+
+def test_bundle_export(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    manifest = BundleExporter(l10n, tmp_path).export()
+    entry = manifest['bundles'][EN]
+
+    content = (tmp_path / entry['file']).read_bytes()
+    is_equal(json.loads(content), dict(l10n.locale().items(include_lang_code=False)))
+    is_equal(entry['size'], len(content))
+    is_equal(gzip.decompress((tmp_path / entry['gz']).read_bytes()), content)
+
+    with open(tmp_path / BundleExporter.manifest_name, encoding='utf-8') as f:
+        is_equal(json.load(f), manifest)
+
+    # nothing changed, nothing rewritten
+    mtime = (tmp_path / entry['file']).stat().st_mtime_ns
+    is_equal(BundleExporter(l10n, tmp_path).export(), manifest)
+    is_equal((tmp_path / entry['file']).stat().st_mtime_ns, mtime)
+
+
+def test_bundle_namespaces(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    manifest = BundleExporter(l10n, tmp_path, namespace_sep='_', compress=False).export()
+    is_equal(list(manifest['bundles']), [f'{EN}/topic'])
+    assert 'gz' not in manifest['bundles'][f'{EN}/topic']
+
+
+def test_bundle_interrupted_export(tmp_path, monkeypatch):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    replace = os.replace
+    calls = []
+
+    def interrupted_replace(src, dst):
+        calls.append(dst)
+        if len(calls) == 2:  # interrupted while writing the gzipped bundle
+            raise KeyboardInterrupt
+        replace(src, dst)
+
+    monkeypatch.setattr(bundle.os, 'replace', interrupted_replace)
+    with pytest.raises(KeyboardInterrupt):
+        BundleExporter(l10n, tmp_path).export()
+
+    # only the complete plain bundle is left, no partial files
+    is_equal([file.suffix for file in tmp_path.iterdir()], ['.json'])
+
+    manifest = BundleExporter(l10n, tmp_path).export()
+    entry = manifest['bundles'][EN]
+    is_equal(gzip.decompress((tmp_path / entry['gz']).read_bytes()), (tmp_path / entry['file']).read_bytes())
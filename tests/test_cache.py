@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+from sl10n import SL10n
+from sl10n._cache import _LocaleCache  # noqa
+
+from . import *
+
+
+def test_bounded_locales():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path, max_locales=1).init()
+
+    # default lang is pinned, so it's never evicted
+    is_equal(set(l10n.locales), {EN})
+    is_equal(set(l10n.languages), {EN, FR})
+
+    locale = l10n.locale(FR)
+    is_equal(locale.lang_code, FR)
+    is_equal(locale.topic_text, TOPIC_TEXT_FR)
+
+    is_equal(l10n.locale(EN).topic_text, TOPIC_TEXT_EN)
+
+    # the pinned default lang takes the only slot, so FR is not kept
+    is_equal(set(l10n.locales), {EN})
+    info = l10n.cache_info()
+    is_equal(info.maxsize, 1)
+    is_equal(info.currsize, 1)
+    is_equal(info.hits, 1)
+    is_equal(info.misses, 1)
+    is_equal(info.evictions, 2)  # at init and after the reload
+
+
+def test_lfu_keeps_use_counts():
+    cache = _LocaleCache(maxsize=2, policy='lfu')
+    cache['a'] = 'A'
+    for _ in range(5):
+        cache.get('a')
+    cache['b'] = 'B'
+    cache.get('b')
+
+    del cache['a']
+    cache['a'] = 'A'  # reloaded, but it was used more than "b"
+    cache['c'] = 'C'
+
+    is_equal(set(cache), {'a', 'c'})
+
+
+def test_unbounded_locales():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path).init()
+
+    is_equal(set(l10n.locales), {EN, FR})
+    is_equal(l10n.cache_info(), None)
+
+
+def test_unknown_eviction_policy():
+    with pytest.raises(ValueError):
+        SL10n(Locale, max_locales=1, eviction='fifo')
+
+
+def test_bounded_locales_bytes_include_escaped_views():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    plain = SL10n(Locale, path, max_locales_bytes=10 ** 6).init()
+    escaped = SL10n(Locale, path, max_locales_bytes=10 ** 6, escapers=['html', 'markdown']).init()
+
+    assert escaped.cache_info().currbytes > plain.cache_info().currbytes * 2
@@ -0,0 +1,84 @@
+import json
+from pathlib import Path
+import threading
+
+from sl10n import SL10n
+from sl10n.pimpl import CachedImpl, JSONImpl
+
+from . import *
+
+
+class CountingImpl(JSONImpl):
+    def __init__(self):
+        super().__init__(json, indent=2, ensure_ascii=False)
+        self.loads = 0
+
+    def load(self, file):
+        self.loads += 1
+        return super().load(file)
+
+
+def test_cached_impl(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    impl = CountingImpl()
+    cached = CachedImpl(impl, tmp_path / 'cache')
+
+    l10n = SL10n(Locale, path, parsing_impl=cached).init()
+    is_equal(impl.loads, 1)
+
+    l10n = SL10n(Locale, path, parsing_impl=cached).init()
+    is_equal(impl.loads, 1)
+
+    locale = l10n.locale()
+    is_equal(locale.topic_title, "Basic 'for' loop algorithm")
+    is_equal(locale.topic_text, TOPIC_TEXT_EN)
+
+
+def test_cached_impl_invalidation(tmp_path):
+    impl = CountingImpl()
+    cached = CachedImpl(impl, tmp_path / 'cache')
+    file = tmp_path / 'en.json'
+
+    with open(file, 'w', encoding='utf-8') as f:
+        cached.dump({'topic_title': 'Old'}, f)
+    with open(file, encoding='utf-8') as f:
+        is_equal(cached.load(f), {'topic_title': 'Old'})
+
+    with open(file, 'w', encoding='utf-8') as f:
+        cached.dump({'topic_title': 'New'}, f)
+    with open(file, encoding='utf-8') as f:
+        is_equal(cached.load(f), {'topic_title': 'New'})
+
+    is_equal(impl.loads, 2)
+
+
+def test_cached_impl_concurrent_start(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    cache_dir = tmp_path / 'nested' / 'cache'
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def start():
+        barrier.wait()
+        try:
+            SL10n(Locale, path, parsing_impl=CachedImpl(JSONImpl(), cache_dir)).init()
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=start) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    is_equal(errors, [])
+    is_equal([file.suffix for file in cache_dir.iterdir()], ['.cache'])
+
+
+def test_cached_impl_unwritable_cache(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    (tmp_path / 'file').touch()
+    cached = CachedImpl(JSONImpl(), tmp_path / 'file' / 'cache')  # can't be created
+
+    locale = SL10n(Locale, path, parsing_impl=cached).init().locale()
+    is_equal(locale.topic_text, TOPIC_TEXT_EN)
@@ -0,0 +1,58 @@
+import asyncio
+from pathlib import Path
+import threading
+
+import pytest
+
+import sl10n
+from sl10n import SL10n
+
+from . import *
+
+
+path = Path(__file__).parent / 'data' / 'test_locale_multi'
+
+
+def test_use():
+    l10n = SL10n(Locale, path).init()
+
+    with pytest.raises(LookupError):
+        sl10n.current()
+
+    with l10n.use(EN) as locale:
+        assert sl10n.current() is locale is l10n.locale(EN)
+        with l10n.use(FR):
+            is_equal(sl10n.current().topic_text, TOPIC_TEXT_FR)
+        is_equal(sl10n.current().topic_text, TOPIC_TEXT_EN)
+
+    with pytest.raises(LookupError):
+        sl10n.current()
+
+
+def test_use_concurrently():
+    l10n = SL10n(Locale, path).init()
+    results = {}
+
+    async def handle(lang):
+        with l10n.use(lang):
+            await asyncio.sleep(0)
+            return sl10n.current().lang_code
+
+    async def main():
+        return await asyncio.gather(handle(EN), handle(FR), handle(EN))
+
+    is_equal(asyncio.run(main()), [EN, FR, EN])
+
+    def work(lang, ready):
+        with l10n.use(lang):
+            ready.wait()
+            results[lang] = sl10n.current().lang_code
+
+    barrier = threading.Barrier(2)
+    threads = [threading.Thread(target=work, args=(lang, barrier)) for lang in (EN, FR)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    is_equal(results, {EN: EN, FR: FR})
@@ -0,0 +1,91 @@
+import json
+from pathlib import Path
+import shutil
+
+import pytest
+
+from sl10n import SL10n
+
+from . import *
+
+
+def test_apply_delta(tmp_path):
+    for file in (Path(__file__).parent / 'data' / 'test_locale_multi').iterdir():
+        shutil.copy(file, tmp_path / file.name)
+
+    l10n = SL10n(Locale, tmp_path).init()
+    old_locale = l10n.locale(FR)
+
+    l10n.apply_delta({FR: {'topic_title': 'Nouveau titre', 'topic_conclusion': ['Ligne 1', 'Ligne 2']}},
+                     persist=True)
+
+    locale = l10n.locale(FR)
+    is_equal(type(locale), Locale)
+    is_equal(locale.topic_title, 'Nouveau titre')
+    is_equal(locale.topic_conclusion, 'Ligne 1\nLigne 2')
+    is_equal(locale.topic_text, TOPIC_TEXT_FR)
+    is_equal(old_locale.topic_title, "Algorithme de base de la boucle 'for'")
+    assert locale.topic_text is old_locale.topic_text, 'unchanged strings must be shared'
+
+    with open(tmp_path / 'fr.json', encoding='utf-8') as f:
+        data = json.load(f)
+    is_equal(data['topic_title'], 'Nouveau titre')
+    is_equal(data['topic_conclusion'], ['Ligne 1', 'Ligne 2'])
+
+    is_equal(SL10n(Locale, tmp_path).init().locale(FR), locale)
+
+
+def test_apply_delta_invalid():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path).init()
+
+    with pytest.raises(ValueError):
+        l10n.apply_delta({EN: {'topic_title': 'Title'}, FR: {'unknown_key': 'Text'}})
+    with pytest.raises(ValueError):
+        l10n.apply_delta({'de': {'topic_title': 'Titel'}})
+
+    is_equal(l10n.locale(EN).topic_title, "Basic 'for' loop algorithm")
+    with pytest.raises(ValueError):
+        l10n.apply_delta({EN: {'topic_title': 42}})
+    with pytest.raises(ValueError):
+        l10n.apply_delta({EN: {'topic_title': ['Line', None]}})
+
+    is_equal(l10n.locale(EN).topic_title, "Basic 'for' loop algorithm")
+
+
+def test_apply_delta_failed_write(tmp_path, monkeypatch):
+    for file in (Path(__file__).parent / 'data' / 'test_locale_multi').iterdir():
+        shutil.copy(file, tmp_path / file.name)
+    en_content = (tmp_path / 'en.json').read_bytes()
+
+    l10n = SL10n(Locale, tmp_path).init()
+    dump = l10n.storage.dump
+
+    def failing_dump(lang, data):
+        if lang == FR:
+            raise OSError('Disk is full')
+        dump(lang, data)
+
+    monkeypatch.setattr(l10n.storage, 'dump', failing_dump)
+    with pytest.raises(OSError):
+        l10n.apply_delta({EN: {'topic_title': 'New title'}, FR: {'topic_title': 'Nouveau titre'}}, persist=True)
+
+    is_equal(l10n.locale(EN).topic_title, "Basic 'for' loop algorithm")
+    is_equal(json.loads((tmp_path / 'en.json').read_bytes()), json.loads(en_content))
+
+
+def test_apply_delta_bounded(tmp_path):
+    for file in (Path(__file__).parent / 'data' / 'test_locale_multi').iterdir():
+        shutil.copy(file, tmp_path / file.name)
+
+    l10n = SL10n(Locale, tmp_path, max_locales=1).init()
+    l10n.apply_delta({FR: {'topic_title': 'Nouveau titre'}})
+    l10n.apply_delta({FR: {'topic_conclusion': 'Fin'}}, persist=True)
+    l10n.locale(EN)
+
+    # FR doesn't fit the cache, so it's reloaded from the file every time
+    locale = l10n.locale(FR)
+    is_equal(locale.topic_title, 'Nouveau titre')
+    is_equal(locale.topic_conclusion, 'Fin')
+    is_equal(locale.topic_text, TOPIC_TEXT_FR)
+    assert FR not in l10n.locales
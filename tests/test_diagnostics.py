@@ -0,0 +1,36 @@
+import json
+from pathlib import Path
+import warnings
+
+from sl10n import SL10n
+from sl10n.warnings import UndefinedLocaleKey, UnexpectedLocaleKey, UnknownModifier
+
+from . import *
+
+
+def test_diagnostics(tmp_path):
+    with open(tmp_path / 'en.json', 'w', encoding='utf-8') as f:
+        json.dump({'topic_title': 'Title', 'odd_key_1': '', 'odd_key_2': '', '$unknown': True}, f)
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter('always')
+        l10n = SL10n(Locale, tmp_path).init()
+
+    # one warning per category
+    is_equal(sorted(w.category.__name__ for w in caught),
+             [UndefinedLocaleKey.__name__, UnexpectedLocaleKey.__name__, UnknownModifier.__name__])
+
+    diagnostics = l10n.diagnostics.files[EN]
+    is_equal(diagnostics.undefined_keys, ['topic_text', 'topic_conclusion'])
+    is_equal(diagnostics.unexpected_keys, ['odd_key_1', 'odd_key_2'])
+    is_equal(diagnostics.unknown_modifiers, ['$unknown'])
+    is_equal(diagnostics.unfilled_keys, [])
+    is_equal(list(l10n.diagnostics.with_issues()), [EN])
+
+
+def test_no_diagnostics():
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    is_equal(bool(l10n.diagnostics), False)
+    is_equal(list(l10n.diagnostics.files), [EN])
@@ -0,0 +1,74 @@
+from pathlib import Path
+import pickle
+
+import pytest
+
+from sl10n import SL10n, escape
+from sl10n.escape import escape_html, escape_markdown, escape_markdown_v2, register_escaper
+
+from . import *
+
+
+path = Path(__file__).parent / 'data' / 'test_locale_multi'
+
+
+def test_escapers():
+    is_equal(escape_html('<b>"Tom" & \'Jerry\'</b>'), '&lt;b&gt;&quot;Tom&quot; &amp; &#x27;Jerry&#x27;&lt;/b&gt;')
+    is_equal(escape_markdown('*bold* [link](url)'), r'\*bold\* \[link\]\(url\)')
+    is_equal(escape_markdown_v2('1 + 1 = 2. Done!'), r'1 \+ 1 \= 2\. Done\!')
+
+
+@pytest.fixture
+def escapers(monkeypatch):
+    # registered escapers are global, so tests register theirs into a copy
+    monkeypatch.setattr(escape, '_escapers', dict(escape._escapers))  # noqa
+
+
+def test_escaped_view(escapers):
+    l10n = SL10n(Locale, path).init()
+    locale = l10n.locale(EN)
+
+    escaped = locale.escaped('markdown_v2')
+    is_equal(type(escaped), Locale)
+    is_equal(escaped.lang_code, EN)
+    is_equal(escaped.topic_text, escape_markdown_v2(TOPIC_TEXT_EN))
+    assert locale.escaped('markdown_v2') is escaped, 'escaped views must be cached'
+    is_equal(pickle.loads(pickle.dumps(locale)), locale)
+
+    register_escaper('upper', str.upper)
+    is_equal(locale.escaped('upper').topic_text, TOPIC_TEXT_EN.upper())
+
+    with pytest.raises(ValueError):
+        locale.escaped('unknown')
+
+
+def test_precomputed_escapers():
+    with pytest.raises(ValueError):
+        SL10n(Locale, path, escapers=['unknown'])
+
+    l10n = SL10n(Locale, path, escapers=['html']).init()
+    locale = l10n.locale(FR)
+    assert 'html' in locale.__dict__['_sl10n_escaped'], 'escaped views must be computed at load'
+    is_equal(locale.escaped('html').topic_text, escape_html(TOPIC_TEXT_FR))
+
+
+def test_shared_escaped_view():
+    l10n = SL10n(Locale, path).init()
+    store = l10n.share()
+
+    try:
+        attached = SL10n(Locale, escapers=['html']).attach(store.name)
+        locale = attached.locale(FR)
+
+        escaped = locale.escaped('html')
+        assert locale.escaped('html') is escaped, 'escaped views must be cached'
+        is_equal(escaped.lang_code, FR)
+        is_equal(escaped.topic_title, escape_html("Algorithme de base de la boucle 'for'"))
+        is_equal(escaped.to_dict(), l10n.locale(FR).escaped('html').to_dict())
+        with pytest.raises(AttributeError):
+            escaped.topic_title = 'Changed'
+
+        attached.detach()
+    finally:
+        store.close()
+        store.unlink()
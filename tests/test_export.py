@@ -0,0 +1,45 @@
+from dataclasses import asdict
+import io
+import json
+from pathlib import Path
+
+from sl10n import SL10n
+
+from . import *
+
+
+def test_to_dict():
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    locale = l10n.locale()
+    is_equal(locale.to_dict(), asdict(locale))
+    is_equal(list(locale.items()), list(asdict(locale).items()))
+    is_equal([k for k, _ in locale.items(include_lang_code=False)], ['topic_title', 'topic_text', 'topic_conclusion'])
+
+
+def test_dump():
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    locale = l10n.locale()
+    expected = dict(locale.items(include_lang_code=False))
+
+    text = io.StringIO()
+    locale.dump(text)
+    is_equal(json.loads(text.getvalue()), expected)
+
+    buffer = io.BytesIO()
+    locale.dump(buffer, include_lang_code=True)
+    is_equal(json.loads(buffer.getvalue().decode()), locale.to_dict())
+
+
+def test_export_all(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path).init()
+
+    exported = l10n.export_all(tmp_path / 'bundle')
+    is_equal(exported, [tmp_path / 'bundle' / 'en.json'])
+
+    with open(exported[0], encoding='utf-8') as f:
+        is_equal(json.load(f), dict(l10n.locale().items(include_lang_code=False)))
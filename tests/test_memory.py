@@ -0,0 +1,58 @@
+from pathlib import Path
+import sys
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.__main__ import main
+
+from . import *
+
+
+def test_memory_report():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path).init(trace_memory=True)
+
+    report = l10n.memory_report(top=2)
+    is_equal(set(report.languages), {EN, FR})
+    is_equal(report.total, sum(report.languages.values()))
+    is_equal(len(report.largest_keys), 2)
+    is_equal(report.largest_keys[0][0], 'topic_text')
+    is_equal(set(report.init_allocations), {EN, FR})
+    assert 'Largest keys:' in report.format()
+
+
+def test_memory_report_cli(capsys):
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    is_equal(main(['memory-report', str(path), 'tests:Locale']), 0)
+
+    out = capsys.readouterr().out
+    assert out.startswith('Total: '), out
+
+
+def test_memory_report_cached_views():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    plain = SL10n(Locale, path).init().memory_report()
+    escaped = SL10n(Locale, path, escapers=['html', 'markdown', 'markdown_v2']).init().memory_report()
+
+    assert escaped.total > plain.total * 2, (escaped.total, plain.total)
+
+
+def test_memory_report_cli_read_only(tmp_path, monkeypatch, capsys):
+    (tmp_path / 'report_locale.py').write_text('from sl10n import SLocale\n\n\n'
+                                               'class ReportLocale(SLocale):\n    a: str\n    b: str\n')
+    (tmp_path / 'lang').mkdir()
+    (tmp_path / 'lang' / 'en.json').write_text('{"a": "A", "c": "C"}')
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(sys, 'path', list(sys.path))
+
+    with pytest.warns(Warning):  # undefined and unexpected keys
+        is_equal(main(['memory-report', 'lang', 'report_locale:ReportLocale']), 0)
+    is_equal((tmp_path / 'lang' / 'en.json').read_text(), '{"a": "A", "c": "C"}')
+    assert capsys.readouterr().out.startswith('Total: ')
+
+    with pytest.raises(SystemExit):
+        main(['memory-report', 'lang', 'report_locale:Missing'])
+    with pytest.raises(SystemExit):
+        main(['memory-report', 'lang', 'report_locale:ReportLocale', '--default-lang', 'de'])
+    assert not (tmp_path / 'lang' / 'de.json').exists()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import gettext
+import struct
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.pimpl import MOImpl
+
+from . import *
+
+
+def test_mo_impl(tmp_path):
+    impl = MOImpl()
+    data = {
+        'topic_title': "Basic 'for' loop algorithm",
+        'topic_text': TOPIC_TEXT_EN.split('\n'),
+        'topic_conclusion': "Now you know basic 'for' loop algorithm!"
+    }
+    with impl.open(tmp_path / 'en.mo', 'w') as f:
+        impl.dump(data, f)
+
+    # must be readable by gettext itself
+    with open(tmp_path / 'en.mo', 'rb') as f:
+        translations = gettext.GNUTranslations(f)
+    is_equal(translations.gettext('topic_text'), TOPIC_TEXT_EN)
+
+    l10n = SL10n(Locale, tmp_path, parsing_impl=impl).init()
+
+    locale = l10n.locale()
+    is_equal(locale.lang_code, EN)
+    is_equal(locale.topic_title, "Basic 'for' loop algorithm")
+    is_equal(locale.topic_text, TOPIC_TEXT_EN)
+    is_equal(locale.topic_conclusion, "Now you know basic 'for' loop algorithm!")
+
+
+def write_catalog(path, messages: dict[bytes, bytes]):
+    # the same layout msgfmt writes: sorted message ids, then their translations, no hash table
+    keys = sorted(messages)
+    ids_offset = 28 + len(keys) * 16
+    strs_offset = ids_offset + sum(len(k) + 1 for k in keys)
+
+    table, offset = [], ids_offset
+    for k in keys:
+        table += [len(k), offset]
+        offset += len(k) + 1
+    offset = strs_offset
+    for k in keys:
+        table += [len(messages[k]), offset]
+        offset += len(messages[k]) + 1
+
+    with open(path, 'wb') as f:
+        f.write(struct.pack('<7I', MOImpl.MAGIC, 0, len(keys), 28, 28 + len(keys) * 8, 0, 0))
+        f.write(struct.pack(f'<{len(table)}I', *table))
+        f.write(b''.join(k + b'\x00' for k in keys))
+        f.write(b''.join(messages[k] + b'\x00' for k in keys))
+
+
+def test_mo_impl_never_redumps(tmp_path):
+    header = (b'Content-Type: text/plain; charset=UTF-8\n'
+              b'Language: de\n'
+              b'Plural-Forms: nplurals=2; plural=(n != 1);\n')
+    write_catalog(tmp_path / 'en.mo', {
+        b'': header,
+        b'topic_title': b'Titel',
+        b'apple\x00apples': 'Apfel\x00Äpfel'.encode('utf-8'),
+        b'menu\x04Open': b'\xc3\x96ffnen',
+        b'Hello, world': b'Hallo, Welt',
+    })
+    content = (tmp_path / 'en.mo').read_bytes()
+
+    with pytest.warns(Warning):  # undefined and unexpected keys
+        l10n = SL10n(Locale, tmp_path, parsing_impl=MOImpl()).init()
+    is_equal(l10n.locale().topic_title, 'Titel')
+
+    is_equal((tmp_path / 'en.mo').read_bytes(), content)
+    with open(tmp_path / 'en.mo', 'rb') as f:
+        translations = gettext.GNUTranslations(f)
+    is_equal(translations.info()['plural-forms'], 'nplurals=2; plural=(n != 1);')
+    is_equal(translations.ngettext('apple', 'apples', 2), 'Äpfel')
+    is_equal(translations.pgettext('menu', 'Open'), 'Öffnen')
+
+    with pytest.raises(PermissionError):
+        l10n.apply_delta({EN: {'topic_title': 'Neuer Titel'}}, persist=True)
@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.exceptions import SL10nIsNotInitialized
+
+from . import *
+
+
+@pytest.mark.parametrize("accept,lang", [
+    ('fr-CA', 'fr_ca'),
+    ('fr_CA', 'fr_ca'),
+    ('fr', 'fr_ca'),
+    ('de-CH,de;q=0.9,en;q=0.8', EN),
+    ('en;q=0.5,fr-CA;q=0.9', 'fr_ca'),
+    ('fr-CA;q=0,en', EN),
+    ('ja', EN),
+    ('*', EN),
+    ('fr, *;q=0.1', 'fr_ca'),
+    ('ja, *, fr', EN),
+    ('', EN),
+    (['ja', 'FR-ca'], 'fr_ca'),
+])
+def test_negotiate(accept, lang):
+    path = Path(__file__).parent / 'data' / 'test_negotiate'
+    l10n = SL10n(Locale, path).init()
+
+    is_equal(l10n.negotiate(accept), lang)
+    is_equal(l10n.locale(l10n.negotiate(accept)).lang_code, 'fr-CA' if lang == 'fr_ca' else EN)
+
+
+def test_negotiate_cached():
+    path = Path(__file__).parent / 'data' / 'test_negotiate'
+    l10n = SL10n(Locale, path).init()
+
+    for _ in range(3):
+        l10n.negotiate('fr-CA,fr;q=0.9')
+    is_equal(l10n._negotiate_cached.cache_info().hits, 2)
+
+
+def test_negotiate_not_initialized():
+    with pytest.raises(SL10nIsNotInitialized):
+        SL10n(Locale).negotiate('en')
@@ -0,0 +1,107 @@
+import copy
+import os
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from sl10n import SL10n
+from sl10n._registry import registry  # noqa
+
+from . import *
+
+
+path = Path(__file__).parent / 'data' / 'test_locale_multi'
+
+
+def test_pickle_by_reference():
+    l10n = SL10n(Locale, path, pickle_by_reference=True).init()
+    locale = l10n.locale(FR)
+
+    data = pickle.dumps(locale)
+    assert len(data) < len(pickle.dumps(locale.to_dict())), 'reference must be smaller than values'
+    assert pickle.loads(data) is locale
+    assert pickle.loads(pickle.dumps(l10n)) is l10n
+
+    l10n.apply_delta({FR: {'topic_title': 'Nouveau titre'}})
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(data)
+    is_equal(pickle.loads(pickle.dumps(l10n.locale(FR))).topic_title, 'Nouveau titre')
+
+    data = pickle.dumps(l10n.locale(EN))
+    del registry[l10n.registry_id]
+    with pytest.raises(pickle.UnpicklingError):
+        pickle.loads(data)
+
+
+def test_pickle_by_value():
+    l10n = SL10n(Locale, path).init()
+    locale = l10n.locale(EN)
+
+    restored = pickle.loads(pickle.dumps(locale))
+    is_equal(restored, locale)
+    is_equal(restored.topic_text, TOPIC_TEXT_EN)
+
+    copied = copy.copy(l10n)
+    assert copied.locale(EN) is locale
+
+
+def test_pickle_fallback():
+    l10n = SL10n(Locale, path, pickle_by_reference=True, pickle_fallback=True).init()
+    locale = l10n.locale(FR)
+
+    data = pickle.dumps(locale)
+    assert pickle.loads(data) is locale
+
+    del registry[l10n.registry_id]
+    restored = pickle.loads(data)
+    assert restored is not locale
+    is_equal(restored, locale)
+    is_equal(type(restored), Locale)
+
+
+POOL_SCRIPT = '''
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from sl10n import SL10n, SLocale
+
+
+class MainLocale(SLocale):
+    topic_title: str
+    topic_text: str
+    topic_conclusion: str
+
+
+def init_worker():
+    global l10n
+    l10n = SL10n(MainLocale, 'tests/data/test_locale_multi', pickle_by_reference=True).init()
+
+
+def title(locale):
+    return locale.topic_title
+
+
+if __name__ == '__main__':
+    init_worker()
+    with ProcessPoolExecutor(2, get_context('spawn'), initializer=init_worker) as pool:
+        print(pool.submit(title, l10n.locale('fr')).result())
+'''
+
+
+def test_pickle_by_reference_main_module(tmp_path):
+    root = Path(__file__).parent.parent
+    script = tmp_path / 'pool.py'
+    script.write_text(POOL_SCRIPT, encoding='utf-8')
+
+    result = subprocess.run([sys.executable, str(script)], cwd=root, capture_output=True, text=True, timeout=60,
+                            env=dict(os.environ, PYTHONPATH=str(root / 'src')))
+
+    is_equal(result.stderr, '')
+    is_equal(result.stdout.strip(), "Algorithme de base de la boucle 'for'")
+
+
+def test_registry_id_absolute():
+    is_equal(SL10n(Locale, path).registry_id, SL10n(Locale, os.path.relpath(path)).registry_id)
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.exceptions import SL10nIsNotInitialized
+from sl10n.warnings import UndefinedLocale, UnexpectedLocaleKey
+
+from . import *
+
+
+def test_render_many():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path).init()
+
+    texts = l10n.render_many('topic_text', [EN, FR, None, FR, EN])
+    is_equal(list(texts), [TOPIC_TEXT_EN, TOPIC_TEXT_FR, TOPIC_TEXT_EN, TOPIC_TEXT_FR, TOPIC_TEXT_EN])
+
+
+def test_render_many_unexpected():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path).init()
+
+    with pytest.warns(UndefinedLocale):
+        is_equal(list(l10n.render_many('topic_text', ['de', 'de'])), [TOPIC_TEXT_EN, TOPIC_TEXT_EN])
+
+    with pytest.warns(UnexpectedLocaleKey):
+        texts = l10n.render_many('unknown_{n}', [EN], n=1)
+    is_equal(list(texts), ['unknown_1'])
+
+
+def test_render_many_not_initialized():
+    with pytest.raises(SL10nIsNotInitialized):
+        SL10n(Locale).render_many('topic_text', [EN])
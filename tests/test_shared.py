@@ -0,0 +1,92 @@
+import copy
+import os
+from pathlib import Path
+import pickle
+import subprocess
+import sys
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.warnings import UnexpectedLocaleKey
+
+from . import *
+
+
+def test_shared_locales():
+    path = Path(__file__).parent / 'data' / 'test_locale_fr'
+    l10n = SL10n(Locale, path, default_lang=FR).init()
+    store = l10n.share()
+
+    try:
+        attached = SL10n(Locale, default_lang=FR).attach(store.name)
+        is_equal(attached.initialized, True)
+
+        locale = attached.locale()
+        is_equal(locale.lang_code, FR)
+        is_equal(locale.topic_text, TOPIC_TEXT_FR)
+        is_equal(locale.to_dict(), l10n.locale().to_dict())
+
+        with pytest.warns(UnexpectedLocaleKey):
+            is_equal(locale.get('unknown_key'), 'unknown_key')
+
+        with pytest.raises(AttributeError):
+            locale.topic_title = 'Changed'
+        with pytest.raises(TypeError):
+            copy.copy(locale)
+        with pytest.raises(TypeError):
+            pickle.dumps(locale)
+
+        escaped = locale.escaped('html')
+        is_equal(copy.copy(escaped).to_dict(), escaped.to_dict())
+
+        attached.detach()
+        is_equal(attached.initialized, False)
+    finally:
+        store.close()
+        store.unlink()
+
+
+def read_shared(name):
+    l10n = SL10n(Locale, default_lang=FR).attach(name)
+    try:
+        return l10n.locale().topic_text
+    finally:
+        l10n.detach()
+
+
+CROSS_PROCESS_SCRIPT = '''
+from multiprocessing import get_context
+from pathlib import Path
+
+from sl10n import SL10n
+from tests import FR, Locale
+from tests.test_shared import read_shared
+
+if __name__ == '__main__':
+    l10n = SL10n(Locale, Path('tests/data/test_locale_fr'), default_lang=FR).init()
+    store = l10n.share()
+    with get_context('spawn').Pool(2) as pool:
+        print(*pool.map(read_shared, [store.name] * 4), sep='\\n---\\n')
+
+    # never detached: the segment must be released at exit without errors
+    attached = SL10n(Locale, default_lang=FR).attach(store.name)
+    attached.locale().topic_text
+
+    store.close()
+    store.unlink()
+'''
+
+
+def test_shared_locales_cross_process(tmp_path):
+    root = Path(__file__).parent.parent
+    script = tmp_path / 'cross_process.py'
+    script.write_text(CROSS_PROCESS_SCRIPT, encoding='utf-8')
+
+    result = subprocess.run([sys.executable, str(script)], cwd=root, capture_output=True, text=True, timeout=60,
+                            env=dict(os.environ, PYTHONPATH=os.pathsep.join([str(root), str(root / 'src')])))
+
+    is_equal(result.returncode, 0)
+    is_equal(result.stdout.strip().split('\n---\n'), [TOPIC_TEXT_FR] * 4)
+    # the resource tracker complains when a segment is unregistered twice or leaked
+    is_equal(result.stderr, '')
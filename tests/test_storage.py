@@ -0,0 +1,47 @@
+from pathlib import Path
+import zipfile
+
+from sl10n import SL10n
+from sl10n.pimpl import JSONImpl
+from sl10n.storage import DirectoryStorage, SQLiteStorage, ZipStorage
+
+from . import *
+
+
+DATA_PATH = Path(__file__).parent / 'data' / 'test_locale_multi'
+
+
+def check_locales(l10n, langs):
+    is_equal(set(l10n.locales), set(langs))
+    is_equal(l10n.locale(EN).topic_text, TOPIC_TEXT_EN)
+    if FR in langs:
+        is_equal(l10n.locale(FR).topic_text, TOPIC_TEXT_FR)
+
+
+def test_zip_storage(tmp_path):
+    archive = tmp_path / 'lang.zip'
+    with zipfile.ZipFile(archive, 'w') as zf:
+        for file in DATA_PATH.iterdir():
+            zf.write(file, f'lang/{file.name}')
+
+    storage = ZipStorage(archive, JSONImpl(), at='lang')
+    is_equal(set(storage.langs()), {EN, FR})
+
+    check_locales(SL10n(Locale, storage=storage).init(), [EN, FR])
+
+
+def test_sqlite_storage(tmp_path):
+    storage = SQLiteStorage(tmp_path / 'lang.sqlite3')
+    storage.copy_from(DirectoryStorage(DATA_PATH, JSONImpl()))
+
+    is_equal(set(storage.langs()), {EN, FR})
+    is_equal(storage.get(FR, 'topic_title'), "Algorithme de base de la boucle 'for'")
+    is_equal(storage.get(FR, 'unknown_key'), None)
+
+    check_locales(SL10n(Locale, storage=storage).init(), [EN, FR])
+    check_locales(SL10n(Locale, storage=storage, only_langs=[]).init(), [EN])
+    storage.close()
+
+    storage = SQLiteStorage(tmp_path / 'lang.sqlite3', read_only=True)
+    check_locales(SL10n(Locale, storage=storage, only_langs=[FR]).init(), [EN, FR])
+    storage.close()
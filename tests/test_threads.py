@@ -0,0 +1,35 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+import warnings
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.exceptions import SL10nStrictException
+
+from . import *
+
+
+def test_concurrent_lookups():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path, max_locales=1).init()
+
+    def lookup(i):
+        lang = (EN, FR)[i % 2]
+        return l10n.locale(lang).get('topic_text')
+
+    with ThreadPoolExecutor(8) as pool:
+        texts = list(pool.map(lookup, range(1000)))
+
+    is_equal(texts, [TOPIC_TEXT_EN, TOPIC_TEXT_FR] * 500)
+
+
+def test_strict_lookup_no_global_state():
+    path = Path(__file__).parent / 'data' / 'test_locale_en'
+    l10n = SL10n(Locale, path, strict=True).init()
+
+    filters = list(warnings.filters)
+    is_equal(l10n.locale(EN).lang_code, EN)
+    with pytest.raises(SL10nStrictException):
+        l10n.locale(FR)
+    is_equal(warnings.filters, filters)
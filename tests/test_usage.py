@@ -0,0 +1,74 @@
+from pathlib import Path
+import pickle
+
+import pytest
+
+from sl10n import SL10n
+from sl10n.usage import UsageTracker
+
+from . import *
+
+
+def test_usage_tracking(tmp_path):
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    tracker = UsageTracker()
+    l10n = SL10n(Locale, path, track_usage=tracker).init()
+
+    locale = l10n.locale(EN)
+    assert isinstance(locale, Locale)
+    is_equal(locale.topic_title, "Basic 'for' loop algorithm")
+    is_equal(l10n.locale(FR).get('topic_text'), TOPIC_TEXT_FR)
+
+    is_equal(tracker.used(), {EN: {'topic_title'}, FR: {'topic_text'}})
+
+    usage_file = tmp_path / 'usage.json'
+    tracker.save(usage_file)
+    is_equal(UsageTracker.load(usage_file).keys(), {'topic_title', 'topic_text'})
+
+
+def test_only_keys():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path, only_keys=['topic_title']).init()
+
+    locale = l10n.locale(FR)
+    is_equal(locale.to_dict(), {'lang_code': FR, 'topic_title': "Algorithme de base de la boucle 'for'"})
+    with pytest.raises(AttributeError):
+        locale.topic_text
+
+
+def test_only_keys_unknown():
+    with pytest.raises(ValueError):
+        SL10n(Locale, only_keys=['unknown_key'])
+
+
+def test_usage_sampling():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    tracker = UsageTracker(sample_rate=0.0)
+    l10n = SL10n(Locale, path, track_usage=tracker).init()
+
+    locale = l10n.locale(EN)
+    is_equal(type(locale), Locale)
+    is_equal(locale.topic_title, "Basic 'for' loop algorithm")
+    is_equal(tracker.used(), {})
+
+    tracker.sample_rate = 1.0
+    assert l10n.locale(EN) is l10n.locale(EN), 'tracked containers must be cached'
+    assert repr(l10n.locale(EN)).startswith('Locale[tracked]('), repr(l10n.locale(EN))
+
+
+def test_usage_pickle():
+    path = Path(__file__).parent / 'data' / 'test_locale_multi'
+    l10n = SL10n(Locale, path, track_usage=UsageTracker(), only_keys=['topic_title']).init()
+    tracked = l10n.locale(FR)
+    pruned = l10n.locales[FR]
+
+    restored = pickle.loads(pickle.dumps(pruned))
+    assert type(restored) is type(pruned), 'pruned containers must be restored with the same class'
+    is_equal(restored, pruned)
+
+    restored = pickle.loads(pickle.dumps(tracked))
+    assert type(restored) is type(pruned), 'tracked containers must be pickled as untracked ones'
+    is_equal(restored.to_dict(), tracked.to_dict())
+
+    tracked = SL10n(Locale, path, track_usage=UsageTracker()).init().locale(EN)
+    is_equal(type(pickle.loads(pickle.dumps(tracked))), Locale)